@@ -0,0 +1,88 @@
+"""
+Numeric kernels for the weather module.
+Compiled with numba when it is installed; otherwise they run as plain NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` when numba is unavailable."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+EARTH_RADIUS_KM = 6371.0
+
+_DISEASE_MIN_TEMP = 20
+
+
+@njit(cache=True, fastmath=True)
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between points given in degrees."""
+    lat1 = np.radians(lat1)
+    lon1 = np.radians(lon1)
+    lat2 = np.radians(lat2)
+    lon2 = np.radians(lon2)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def haversine_km_many(lat1, lon1, lats, lons):
+        """Distances in km from one point to each of ``lats``/``lons``."""
+        out = np.empty(lats.shape[0])
+        for i in prange(lats.shape[0]):
+            out[i] = haversine_km(lat1, lon1, lats[i], lons[i])
+        return out
+else:
+    def haversine_km_many(lat1, lon1, lats, lons):
+        """Distances in km from one point to each of ``lats``/``lons``."""
+        return haversine_km(lat1, lon1, lats, lons)
+
+
+@njit(cache=True)
+def agri_metrics(temp, hum, base, low_temp, high_temp, high_humidity):
+    """
+    Agricultural metrics for one reading.
+
+    Thresholds are arguments rather than module globals: numba freezes
+    globals into the on-disk cache, which would pin them to whatever the
+    settings were at first compile.
+
+    Returns (growing_degree_days, frost_risk, heat_stress_risk, disease_risk).
+    """
+    gdd = max(0.0, temp - base)
+    return (
+        gdd,
+        temp <= low_temp,
+        temp >= high_temp,
+        hum >= high_humidity and temp >= _DISEASE_MIN_TEMP,
+    )
+
+
+@njit(cache=True)
+def agri_metrics_many(temps, hums, base, low_temp, high_temp, high_humidity):
+    """
+    Array form of ``agri_metrics`` over N readings.
+
+    ``temps`` and ``hums`` must be float arrays without NaNs; callers drop
+    incomplete readings before building them.
+    """
+    gdd = np.maximum(0.0, temps - base)
+    return (
+        gdd,
+        temps <= low_temp,
+        temps >= high_temp,
+        (hums >= high_humidity) & (temps >= _DISEASE_MIN_TEMP),
+    )
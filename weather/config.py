@@ -28,6 +28,16 @@ WEATHER_CONFIG: Dict[str, Any] = {
         'HEATWAVE_WARNING_TEMP': 40  # Temperature threshold for heatwave warnings
     },
 
+    # Plausible ranges for incoming readings, used by model validators
+    'VALIDATION': {
+        'MIN_TEMPERATURE': getattr(settings, 'WEATHER_MIN_VALID_TEMP', -10),
+        'MAX_TEMPERATURE': getattr(settings, 'WEATHER_MAX_VALID_TEMP', 55),
+        'MIN_HUMIDITY': 0,
+        'MAX_HUMIDITY': 100,
+        'MAX_WIND_SPEED': 200,  # km/h
+        'MAX_RAINFALL': 500,  # mm
+    },
+
     # Growing Degree Days calculation
     'GROWING_DEGREE_DAYS': {
         'BASE_TEMPERATURE': getattr(settings, 'WEATHER_GDD_BASE_TEMP', 10),
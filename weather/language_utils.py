@@ -3,7 +3,8 @@ Utilities for handling multilingual weather information.
 Supports Hindi, Haryanvi, and English translations.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from django.conf import settings
 from django.utils.translation import gettext as _
 
@@ -122,13 +123,15 @@ class WeatherTranslator:
         self.language = preferred_language or WEATHER_CONFIG['DEFAULT_LANGUAGE']
         if self.language not in WEATHER_CONFIG['LANGUAGES']:
             self.language = 'en'
+        self._table = _TRANSLATIONS[self.language]
+
+    def _t(self, category: str, key: str) -> str:
+        """Look up ``key`` in a translation category, falling back to the key."""
+        return self._table[category].get(key, key)
 
     def get_weather_condition(self, condition: str) -> str:
         """Get weather condition in preferred language."""
-        try:
-            return WEATHER_CONDITIONS[condition][self.language]
-        except KeyError:
-            return condition
+        return self._t('weather_condition', condition)
 
     def get_temperature_description(self, temperature: float) -> str:
         """Get temperature description in preferred language."""
@@ -143,7 +146,7 @@ class WeatherTranslator:
         else:
             range_key = 'HOT'
         
-        return self.TEMPERATURE_RANGES[range_key][self.language]
+        return self._t('temperature_range', range_key)
 
     def get_soil_condition(self, moisture_percentage: float) -> str:
         """Get soil condition description in preferred language."""
@@ -154,21 +157,15 @@ class WeatherTranslator:
         else:
             condition = 'MOIST'
         
-        return self.SOIL_CONDITIONS[condition][self.language]
+        return self._t('soil_condition', condition)
 
     def get_alert_type(self, alert_type: str) -> str:
         """Get alert type in preferred language."""
-        try:
-            return self.ALERT_TYPES[alert_type][self.language]
-        except KeyError:
-            return alert_type
+        return self._t('alert_type', alert_type)
 
     def get_farming_action(self, action: str) -> str:
         """Get farming action in preferred language."""
-        try:
-            return self.FARMING_ACTIONS[action][self.language]
-        except KeyError:
-            return action
+        return self._t('farming_action', action)
 
     def translate_weather_data(self, weather_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -254,4 +251,37 @@ class WeatherTranslator:
         if weather_data.get('temperature', 20) <= 5:
             recommendations.append(self.get_farming_action('PROTECT'))
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+
+def _build_translation_table() -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Flatten the per-key translation tables into ``[lang][category][key]``."""
+    categories = {
+        'weather_condition': WEATHER_CONDITIONS,
+        'temperature_range': WeatherTranslator.TEMPERATURE_RANGES,
+        'soil_condition': WeatherTranslator.SOIL_CONDITIONS,
+        'alert_type': WeatherTranslator.ALERT_TYPES,
+        'farming_action': WeatherTranslator.FARMING_ACTIONS,
+    }
+    return {
+        language: {
+            category: {key: labels[language] for key, labels in table.items()}
+            for category, table in categories.items()
+        }
+        for language in WEATHER_CONFIG['LANGUAGES']
+    }
+
+
+# Resolved once at import so each translated field costs a single lookup
+_TRANSLATIONS = _build_translation_table()
+
+
+@lru_cache(maxsize=32)
+def get_translator(preferred_language: Optional[str] = None) -> WeatherTranslator:
+    """
+    Return the shared translator for a language.
+
+    Translators hold no per-request state, so one instance per language
+    code is reused across requests and serializer fields.
+    """
+    return WeatherTranslator(preferred_language)
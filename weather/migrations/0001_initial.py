@@ -1,89 +1,151 @@
-# Generated by Django 5.1.7 on 2025-03-17 17:11
+# Generated by Django 4.2.30 on 2026-10-15 22:58
 
+import django.core.validators
 from django.db import migrations, models
+import django.db.models.deletion
 
 
 class Migration(migrations.Migration):
 
     initial = True
 
-    dependencies = []
+    dependencies = [
+        ('crops', '0001_initial'),
+    ]
 
     operations = [
         migrations.CreateModel(
-            name="WeatherAlert",
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name of the location (village/city)', max_length=100)),
+                ('district', models.CharField(help_text='District name', max_length=100)),
+                ('state', models.CharField(default='Haryana', help_text='State name (defaults to Haryana)', max_length=100)),
+                ('latitude', models.DecimalField(decimal_places=6, help_text='Geographical latitude (-90 to 90)', max_digits=9, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)])),
+                ('longitude', models.DecimalField(decimal_places=6, help_text='Geographical longitude (-180 to 180)', max_digits=9, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)])),
+                ('elevation', models.FloatField(blank=True, help_text='Elevation in meters', null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WeatherForecast',
             fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("location", models.CharField(max_length=100)),
-                ("alert_type", models.CharField(max_length=50)),
-                (
-                    "severity",
-                    models.CharField(
-                        choices=[
-                            ("LOW", "Low"),
-                            ("MEDIUM", "Medium"),
-                            ("HIGH", "High"),
-                        ],
-                        max_length=10,
-                    ),
-                ),
-                ("description", models.TextField()),
-                ("start_time", models.DateTimeField()),
-                ("end_time", models.DateTimeField()),
-                ("created_at", models.DateTimeField(auto_now_add=True)),
-                ("is_active", models.BooleanField(default=True)),
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('forecast_date', models.DateField()),
+                ('min_temperature', models.FloatField()),
+                ('max_temperature', models.FloatField()),
+                ('humidity', models.FloatField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('rainfall_probability', models.FloatField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('expected_rainfall', models.FloatField(default=0, help_text='Expected rainfall in mm')),
+                ('wind_speed', models.FloatField(help_text='Expected wind speed in km/h')),
+                ('weather_condition', models.CharField(choices=[('CLEAR', {'en': 'Clear', 'hi': 'साफ़', 'hr': 'साफ'}), ('PARTLY_CLOUDY', {'en': 'Partly Cloudy', 'hi': 'आंशिक रूप से बादल', 'hr': 'थोड़े बादल'}), ('CLOUDY', {'en': 'Cloudy', 'hi': 'बादल', 'hr': 'बादल'}), ('RAIN', {'en': 'Rain', 'hi': 'बारिश', 'hr': 'बरखा'}), ('THUNDERSTORM', {'en': 'Thunderstorm', 'hi': 'आंधी', 'hr': 'आंधी'}), ('FOG', {'en': 'Fog', 'hi': 'कोहरा', 'hr': 'कुहरा'}), ('HAZE', {'en': 'Haze', 'hi': 'धुंध', 'hr': 'धुंध'})], max_length=100)),
+                ('frost_risk', models.BooleanField(default=False)),
+                ('heat_stress_risk', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('confidence_level', models.FloatField(help_text='Forecast confidence level in percentage', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='weather.location')),
             ],
+            options={
+                'ordering': ['forecast_date'],
+            },
         ),
         migrations.CreateModel(
-            name="WeatherData",
+            name='WeatherData',
             fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("location", models.CharField(max_length=100)),
-                ("temperature", models.FloatField()),
-                ("humidity", models.FloatField()),
-                ("rainfall", models.FloatField()),
-                ("wind_speed", models.FloatField()),
-                ("weather_condition", models.CharField(max_length=100)),
-                ("timestamp", models.DateTimeField()),
-                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('temperature', models.FloatField(validators=[django.core.validators.MinValueValidator(-10), django.core.validators.MaxValueValidator(55)])),
+                ('humidity', models.FloatField(help_text='Relative humidity percentage', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('rainfall', models.FloatField(help_text='Rainfall in mm', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(500)])),
+                ('wind_speed', models.FloatField(help_text='Wind speed in km/h', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(200)])),
+                ('wind_direction', models.IntegerField(help_text='Wind direction in degrees', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(360)])),
+                ('soil_temperature', models.FloatField(blank=True, help_text='Soil temperature in Celsius', null=True)),
+                ('soil_moisture', models.FloatField(blank=True, help_text='Soil moisture percentage', null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('solar_radiation', models.FloatField(blank=True, help_text='Solar radiation in W/m²', null=True, validators=[django.core.validators.MinValueValidator(0)])),
+                ('weather_condition', models.CharField(choices=[('CLEAR', {'en': 'Clear', 'hi': 'साफ़', 'hr': 'साफ'}), ('PARTLY_CLOUDY', {'en': 'Partly Cloudy', 'hi': 'आंशिक रूप से बादल', 'hr': 'थोड़े बादल'}), ('CLOUDY', {'en': 'Cloudy', 'hi': 'बादल', 'hr': 'बादल'}), ('RAIN', {'en': 'Rain', 'hi': 'बारिश', 'hr': 'बरखा'}), ('THUNDERSTORM', {'en': 'Thunderstorm', 'hi': 'आंधी', 'hr': 'आंधी'}), ('FOG', {'en': 'Fog', 'hi': 'कोहरा', 'hr': 'कुहरा'}), ('HAZE', {'en': 'Haze', 'hi': 'धुंध', 'hr': 'धुंध'})], max_length=100)),
+                ('timestamp', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('data_source', models.CharField(help_text='Source of weather data (e.g., IMD, Local Station)', max_length=50)),
+                ('location', models.ForeignKey(help_text='Location where weather was measured', on_delete=django.db.models.deletion.CASCADE, to='weather.location')),
             ],
+            options={
+                'ordering': ['-timestamp'],
+            },
         ),
         migrations.CreateModel(
-            name="WeatherForecast",
+            name='WeatherAlert',
             fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("location", models.CharField(max_length=100)),
-                ("forecast_date", models.DateField()),
-                ("min_temperature", models.FloatField()),
-                ("max_temperature", models.FloatField()),
-                ("humidity", models.FloatField()),
-                ("rainfall_probability", models.FloatField()),
-                ("weather_condition", models.CharField(max_length=100)),
-                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alert_type', models.CharField(choices=[('FROST', 'Frost Warning'), ('HEATWAVE', 'Heat Wave'), ('HEAVY_RAIN', 'Heavy Rainfall'), ('STORM', 'Storm Warning'), ('PEST', 'Pest Weather Conditions'), ('DISEASE', 'Disease Favorable Weather')], max_length=50)),
+                ('severity', models.CharField(choices=[('LOW', 'Low'), ('MEDIUM', 'Medium'), ('HIGH', 'High'), ('EXTREME', 'Extreme')], max_length=10)),
+                ('description', models.TextField()),
+                ('recommended_actions', models.TextField(help_text='Recommended actions for farmers')),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('resolution_notes', models.TextField(blank=True)),
+                ('actual_impact', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('affected_crops', models.ManyToManyField(help_text='Crops that might be affected by this weather condition', to='crops.crop')),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='weather.location')),
             ],
+            options={
+                'ordering': ['-start_time'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['district'], name='weather_loc_distric_8545b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['state'], name='weather_loc_state_fceb23_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['latitude', 'longitude'], name='weather_loc_latitud_1f8130_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='location',
+            unique_together={('latitude', 'longitude')},
+        ),
+        migrations.AddIndex(
+            model_name='weatherforecast',
+            index=models.Index(fields=['location', 'forecast_date'], name='weather_wea_locatio_0422ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherforecast',
+            index=models.Index(fields=['forecast_date'], name='weather_wea_forecas_ba9798_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherforecast',
+            index=models.Index(fields=['location', 'weather_condition'], name='weather_wea_locatio_b1f90b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['location', '-timestamp'], name='weather_wea_locatio_4dbed4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['-timestamp'], name='weather_wea_timesta_3b077a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['location', 'weather_condition'], name='weather_wea_locatio_c0290e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['temperature', 'humidity'], name='weather_wea_tempera_96dc59_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatheralert',
+            index=models.Index(fields=['location', 'start_time'], name='weather_wea_locatio_975f00_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatheralert',
+            index=models.Index(fields=['is_active'], name='weather_wea_is_acti_f03d70_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatheralert',
+            index=models.Index(fields=['alert_type', 'severity'], name='weather_wea_alert_t_5b595d_idx'),
         ),
     ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0002_weatheralert_wa_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weatheralert',
+            name='offline_id',
+            field=models.CharField(blank=True, editable=False, help_text='Offline store uuid; makes re-syncing the same row a no-op', max_length=32, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='offline_id',
+            field=models.CharField(blank=True, editable=False, help_text='Offline store uuid; makes re-syncing the same row a no-op', max_length=32, null=True, unique=True),
+        ),
+    ]
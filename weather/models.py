@@ -3,15 +3,18 @@ Models for the weather application.
 Defines database schema for weather-related data with validation and utility methods.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from decimal import Decimal
+import numpy as np
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.core.exceptions import ValidationError
 
 from .config import WEATHER_CONFIG, ALERT_SEVERITY_LEVELS, WEATHER_CONDITIONS
 from .exceptions import WeatherDataValidationError
+from ._numeric import agri_metrics, haversine_km, haversine_km_many
 
 class Location(models.Model):
     """
@@ -77,20 +80,26 @@ class Location(models.Model):
 
     def get_distance_to(self, lat: Decimal, lon: Decimal) -> float:
         """Calculate distance to another point using Haversine formula."""
-        from math import radians, cos, sin, asin, sqrt
-        
-        def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-            R = 6371  # Earth radius in kilometers
-            dlat = radians(float(lat2 - lat1))
-            dlon = radians(float(lon2 - lon1))
-            lat1 = radians(float(lat1))
-            lat2 = radians(float(lat2))
-            
-            a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-            c = 2 * asin(sqrt(a))
-            return R * c
-            
-        return haversine(self.latitude, self.longitude, lat, lon)
+        return float(haversine_km(
+            float(self.latitude), float(self.longitude), float(lat), float(lon)
+        ))
+
+    def get_distance_to_many(
+        self,
+        lats: Sequence[float],
+        lons: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Calculate distances in km to many points in one vectorized pass.
+
+        Coordinates are cast to float64 once; no trig is done on Decimal.
+        """
+        return haversine_km_many(
+            float(self.latitude),
+            float(self.longitude),
+            np.asarray(lats, dtype=np.float64),
+            np.asarray(lons, dtype=np.float64)
+        )
 
     def get_current_weather(self) -> Optional['WeatherData']:
         """Get the most recent weather data for this location."""
@@ -132,6 +141,7 @@ class WeatherData(models.Model):
         weather_condition (str): General weather condition
         timestamp (datetime): When the measurement was taken
         data_source (str): Source of the weather data
+        offline_id (str): Id of the offline record this row was synced from
     """
     
     location = models.ForeignKey(
@@ -194,6 +204,14 @@ class WeatherData(models.Model):
         max_length=50,
         help_text="Source of weather data (e.g., IMD, Local Station)"
     )
+    offline_id = models.CharField(
+        max_length=32,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Offline store uuid; makes re-syncing the same row a no-op"
+    )
 
     class Meta:
         indexes = [
@@ -229,20 +247,26 @@ class WeatherData(models.Model):
 
     def get_agricultural_metrics(self) -> dict:
         """Calculate agricultural metrics from weather data."""
+        thresholds = WEATHER_CONFIG['ALERT_THRESHOLDS']
+        gdd, frost_risk, heat_stress_risk, disease_risk = agri_metrics(
+            float(self.temperature),
+            float(self.humidity),
+            float(WEATHER_CONFIG['GROWING_DEGREE_DAYS']['BASE_TEMPERATURE']),
+            float(thresholds['LOW_TEMPERATURE']),
+            float(thresholds['HIGH_TEMPERATURE']),
+            float(thresholds['HIGH_HUMIDITY'])
+        )
         return {
-            'growing_degree_days': self._calculate_growing_degree_days(),
-            'frost_risk': self.temperature <= WEATHER_CONFIG['ALERT_THRESHOLDS']['LOW_TEMPERATURE'],
-            'heat_stress_risk': self.temperature >= WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_TEMPERATURE'],
-            'disease_risk': (
-                self.humidity >= WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_HUMIDITY'] and
-                self.temperature >= 20
-            )
+            'growing_degree_days': gdd,
+            'frost_risk': frost_risk,
+            'heat_stress_risk': heat_stress_risk,
+            'disease_risk': disease_risk
         }
-        
-    def _calculate_growing_degree_days(self) -> float:
-        """Calculate growing degree days."""
-        base_temp = WEATHER_CONFIG['GROWING_DEGREE_DAYS']['BASE_TEMPERATURE']
-        return max(0, self.temperature - base_temp)
+
+    @cached_property
+    def agricultural_metrics(self) -> dict:
+        """Agricultural metrics, computed once per instance."""
+        return self.get_agricultural_metrics()
 
 class WeatherForecast(models.Model):
     """
@@ -316,6 +340,34 @@ class WeatherForecast(models.Model):
         """Calculate average temperature."""
         return (self.max_temperature + self.min_temperature) / 2
 
+    @cached_property
+    def agricultural_conditions(self) -> dict:
+        """
+        Language-independent growing conditions, computed once per instance.
+
+        ``irrigation_action`` is a farming action key ('IRRIGATE', 'SPRAY')
+        or None when conditions only need monitoring.
+        """
+        avg_temp = self.get_average_temperature()
+        if self.rainfall_probability < 30:
+            irrigation_action = 'IRRIGATE'
+        elif self.rainfall_probability > 70:
+            irrigation_action = 'SPRAY'
+        else:
+            irrigation_action = None
+        return {
+            'growing_conditions': (
+                'favorable' if (15 <= avg_temp <= 30 and 40 <= self.humidity <= 70)
+                else 'unfavorable'
+            ),
+            'risks': {
+                'frost': self.min_temperature <= 2,
+                'heat_stress': self.max_temperature >= 35,
+                'disease': self.humidity >= 80 and avg_temp >= 20
+            },
+            'irrigation_action': irrigation_action
+        }
+
 class WeatherAlert(models.Model):
     """
     Weather alert for dangerous or significant weather conditions.
@@ -330,6 +382,7 @@ class WeatherAlert(models.Model):
         end_time (datetime): When the alert ends
         is_active (bool): Whether the alert is currently active
         affected_crops (ManyToMany): Crops that may be affected
+        offline_id (str): Id of the offline record this row was synced from
     """
     
     ALERT_TYPES = [
@@ -366,12 +419,26 @@ class WeatherAlert(models.Model):
         'crops.Crop',
         help_text="Crops that might be affected by this weather condition"
     )
+    offline_id = models.CharField(
+        max_length=32,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Offline store uuid; makes re-syncing the same row a no-op"
+    )
 
     class Meta:
         indexes = [
             models.Index(fields=['location', 'start_time']),
             models.Index(fields=['is_active']),
             models.Index(fields=['alert_type', 'severity']),
+            # Active-alert lookups by location; only active rows are indexed
+            models.Index(
+                fields=['location', 'end_time'],
+                condition=models.Q(is_active=True),
+                name='wa_active'
+            ),
         ]
         ordering = ['-start_time']
 
@@ -6,12 +6,14 @@ Handles data synchronization, storage, and offline access capabilities.
 import json
 import logging
 import sqlite3
+import uuid
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 from pathlib import Path
 from django.core.cache import cache
 from django.utils import timezone
 from django.conf import settings
+from django.db import transaction
 
 from .models import WeatherData, WeatherForecast, WeatherAlert
 from .exceptions import WeatherDataError
@@ -19,37 +21,223 @@ from .config import WEATHER_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Offline table and insert columns for each storable data type
+_INSERT_SPECS = {
+    'weather_data': (
+        'weather_data',
+        ('temperature', 'humidity', 'rainfall', 'timestamp', 'data_source')
+    ),
+    'alert': (
+        'weather_alerts',
+        ('alert_type', 'severity', 'description', 'start_time', 'end_time')
+    ),
+}
+
+# INSERT statements precomputed once per data type
+_INSERT_SQL = {
+    data_type: (
+        f"INSERT INTO {table} (id, location_id, {', '.join(columns)}, sync_status) "
+        f"VALUES (?, ?, {', '.join('?' for _ in columns)}, 'pending')"
+    )
+    for data_type, (table, columns) in _INSERT_SPECS.items()
+}
+
+
+# Offline schema version, stored in PRAGMA user_version. Version 2 keys
+# readings and alerts by (location, time, uuid) in WITHOUT ROWID tables and
+# stores times as epoch seconds.
+_SCHEMA_VERSION = 2
+
+# Readings and alerts are clustered on (location, time) so per-location range
+# reads walk the table B-tree directly instead of going through a rowid.
+_CREATE_TABLE_SQL = {
+    'weather_data': """
+        CREATE TABLE IF NOT EXISTS weather_data (
+            id TEXT NOT NULL,
+            location_id INTEGER NOT NULL,
+            temperature REAL,
+            humidity REAL,
+            rainfall REAL,
+            timestamp REAL NOT NULL,
+            data_source TEXT,
+            sync_status TEXT,
+            PRIMARY KEY (location_id, timestamp, id)
+        ) WITHOUT ROWID
+    """,
+    'weather_alerts': """
+        CREATE TABLE IF NOT EXISTS weather_alerts (
+            id TEXT NOT NULL,
+            location_id INTEGER NOT NULL,
+            alert_type TEXT,
+            severity TEXT,
+            description TEXT,
+            start_time REAL NOT NULL,
+            end_time REAL,
+            sync_status TEXT,
+            PRIMARY KEY (location_id, start_time, id)
+        ) WITHOUT ROWID
+    """,
+}
+
+# Column lists of the version 1 tables (INTEGER AUTOINCREMENT ids). Their time
+# columns hold ISO strings, or epoch seconds if written after the switch.
+_LEGACY_COLUMNS = {
+    'weather_data': (
+        ('temperature', 'humidity', 'rainfall', 'data_source', 'sync_status'),
+        ('timestamp',)
+    ),
+    'weather_alerts': (
+        ('alert_type', 'severity', 'description', 'sync_status'),
+        ('start_time', 'end_time')
+    ),
+}
+
+
+def _epoch_sql(column: str) -> str:
+    """SQL expression converting a legacy time column to epoch seconds."""
+    return (
+        f"CASE WHEN {column} GLOB '[0-9][0-9][0-9][0-9]-*' "
+        f"THEN (julianday({column}) - 2440587.5) * 86400.0 "
+        f"ELSE CAST({column} AS REAL) END"
+    )
+
+
+# Cleanup deletes compare the bare timestamp column against a bound cutoff so
+# the partial indexes on synced rows can serve them as range searches.
+_CLEANUP_WEATHER_SQL = (
+    "DELETE FROM weather_data WHERE timestamp < ? AND sync_status = 'synced'"
+)
+_CLEANUP_ALERTS_SQL = (
+    "DELETE FROM weather_alerts WHERE end_time < ? AND sync_status = 'synced'"
+)
+
+# Offline table, time column and column order for each readable data type
+_SELECT_SPECS = {
+    'weather_data': (
+        'weather_data',
+        'timestamp',
+        ('id', 'location_id', 'temperature', 'humidity', 'rainfall',
+         'timestamp', 'data_source', 'sync_status')
+    ),
+    'alerts': (
+        'weather_alerts',
+        'start_time',
+        ('id', 'location_id', 'alert_type', 'severity', 'description',
+         'start_time', 'end_time', 'sync_status')
+    ),
+}
+
+
+# Rows per INSERT when pushing pending offline rows to the server database
+_SYNC_BATCH_SIZE = 500
+
+
+# Durability settings for the offline store. The fast profile skips fsync;
+# the safe profile (WAL with NORMAL sync) survives a crash. Which one applies
+# is chosen by OfflineDataManager's safe_mode argument.
+_FAST_PRAGMAS = """
+    PRAGMA synchronous=OFF;
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+_SAFE_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA journal_mode=WAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+
+
+def _to_sql_value(value: Any) -> Any:
+    """Convert a Python value into its offline storage representation."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+def _from_epoch(value: float) -> datetime:
+    """Convert a stored epoch-seconds timestamp back into an aware datetime."""
+    return datetime.fromtimestamp(value, tz=dt_timezone.utc)
+
+
+class OfflineRow(dict):
+    """
+    One offline record as returned by ``get_offline_data``.
+
+    Time columns hold epoch seconds so they compare as plain numbers;
+    ``as_datetime`` converts one only when a caller asks for it.
+    """
+
+    def __init__(self, data, time_column: str):
+        super().__init__(data)
+        self.time_column = time_column
+
+    def as_datetime(self, column: Optional[str] = None) -> Optional[datetime]:
+        """Return a time column (the row's main one by default) as an aware datetime."""
+        value = self[column or self.time_column]
+        return None if value is None else _from_epoch(value)
+
 class OfflineDataManager:
     """
     Manages offline data storage and synchronization for the weather module.
     Provides mechanisms to store and retrieve weather data when offline.
     """
 
-    def __init__(self):
+    def __init__(self, safe_mode: Optional[bool] = None):
+        """
+        Args:
+            safe_mode: True forces the safe PRAGMA profile and False the fast
+                one. The default (None) picks fast for ':memory:' databases
+                and safe for files, since a file store holds rows that have
+                not reached the server yet and must survive a crash.
+        """
         self.offline_db_path = Path(settings.BASE_DIR) / 'weather_offline.db'
         self.sync_interval = WEATHER_CONFIG['OFFLINE_MODE']['SYNC_FREQUENCY']
         self.min_storage_days = WEATHER_CONFIG['OFFLINE_MODE']['MIN_STORAGE_DAYS']
         self.compress_data = WEATHER_CONFIG['OFFLINE_MODE']['COMPRESS_DATA']
-        
+        self.safe_mode = safe_mode
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply the durability PRAGMAs for the database path and mode."""
+        safe = self.safe_mode
+        if safe is None:
+            safe = str(self.offline_db_path) != ':memory:'
+        conn.executescript(_SAFE_PRAGMAS if safe else _FAST_PRAGMAS)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Return the shared offline database connection, opening it if needed.
+
+        Every operation reuses this one connection, which also keeps a
+        ``:memory:`` database alive across calls.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                str(self.offline_db_path),
+                check_same_thread=False
+            )
+            self._apply_pragmas(self._conn)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared offline database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def initialize_offline_storage(self) -> None:
         """Initialize SQLite database for offline storage."""
         try:
-            conn = sqlite3.connect(str(self.offline_db_path))
+            conn = self._get_connection()
             cursor = conn.cursor()
 
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                self._migrate_legacy_tables(conn)
+
             # Create tables for offline storage
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS weather_data (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    location_id INTEGER NOT NULL,
-                    temperature REAL,
-                    humidity REAL,
-                    rainfall REAL,
-                    timestamp TEXT,
-                    data_source TEXT,
-                    sync_status TEXT
-                )
-            """)
+            cursor.execute(_CREATE_TABLE_SQL['weather_data'])
 
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS weather_forecasts (
@@ -63,27 +251,69 @@ class OfflineDataManager:
                 )
             """)
 
+            cursor.execute(_CREATE_TABLE_SQL['weather_alerts'])
+
+            # Indexes for pending-sync scans and cleanup of synced rows
             cursor.execute("""
-                CREATE TABLE IF NOT EXISTS weather_alerts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    location_id INTEGER NOT NULL,
-                    alert_type TEXT,
-                    severity TEXT,
-                    description TEXT,
-                    start_time TEXT,
-                    end_time TEXT,
-                    sync_status TEXT
-                )
+                CREATE INDEX IF NOT EXISTS idx_wd_pending
+                ON weather_data (location_id) WHERE sync_status = 'pending'
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_wd_synced_ts
+                ON weather_data (timestamp) WHERE sync_status = 'synced'
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_wa_synced_end
+                ON weather_alerts (end_time) WHERE sync_status = 'synced'
             """)
 
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             conn.commit()
-            conn.close()
             logger.info("Offline storage initialized successfully")
         
         except sqlite3.Error as e:
             logger.error(f"Error initializing offline storage: {e}")
             raise WeatherDataError("Failed to initialize offline storage")
 
+    def _migrate_legacy_tables(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuild version 1 readings/alerts tables in the current layout.
+
+        Rows keep their data and sync status; each gets a fresh uuid and its
+        ISO-string times are converted to epoch seconds. Rows without a
+        time could never be synced or cleaned up and are dropped.
+        """
+        for table, (columns, time_columns) in _LEGACY_COLUMNS.items():
+            id_types = [
+                column_type for _, name, column_type, *_ in
+                conn.execute(f"PRAGMA table_info({table})")
+                if name == 'id'
+            ]
+            if id_types != ['INTEGER']:
+                continue
+
+            legacy = f"{table}_legacy"
+            copied = ('location_id',) + columns + time_columns
+            try:
+                conn.executescript(f"""
+                    BEGIN;
+                    ALTER TABLE {table} RENAME TO {legacy};
+                    {_CREATE_TABLE_SQL[table]};
+                    INSERT INTO {table} (id, {', '.join(copied)})
+                    SELECT lower(hex(randomblob(16))),
+                           location_id, {', '.join(columns)},
+                           {', '.join(_epoch_sql(column) for column in time_columns)}
+                    FROM {legacy}
+                    WHERE {time_columns[0]} IS NOT NULL;
+                    DROP TABLE {legacy};
+                    COMMIT;
+                """)
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            logger.info(f"Migrated offline table {table} to schema version {_SCHEMA_VERSION}")
+
     def sync_data(self, location_id: int) -> bool:
         """
         Synchronize offline data with server when connection is available.
@@ -100,55 +330,20 @@ class OfflineDataManager:
             if last_sync and (timezone.now() - last_sync).hours < self.sync_interval:
                 return True
 
-            conn = sqlite3.connect(str(self.offline_db_path))
-            cursor = conn.cursor()
-
-            # Sync unsynced weather data
-            cursor.execute(
-                "SELECT * FROM weather_data WHERE sync_status = 'pending'"
-            )
-            pending_data = cursor.fetchall()
-            
-            for data in pending_data:
-                weather_data = WeatherData(
-                    location_id=data[1],
-                    temperature=data[2],
-                    humidity=data[3],
-                    rainfall=data[4],
-                    timestamp=datetime.fromisoformat(data[5]),
-                    data_source=data[6]
-                )
-                weather_data.save()
-                
-                cursor.execute(
-                    "UPDATE weather_data SET sync_status = 'synced' WHERE id = ?",
-                    (data[0],)
-                )
-
-            # Sync alerts
-            cursor.execute(
-                "SELECT * FROM weather_alerts WHERE sync_status = 'pending'"
-            )
-            pending_alerts = cursor.fetchall()
-            
-            for alert in pending_alerts:
-                weather_alert = WeatherAlert(
-                    location_id=alert[1],
-                    alert_type=alert[2],
-                    severity=alert[3],
-                    description=alert[4],
-                    start_time=datetime.fromisoformat(alert[5]),
-                    end_time=datetime.fromisoformat(alert[6])
-                )
-                weather_alert.save()
-                
-                cursor.execute(
-                    "UPDATE weather_alerts SET sync_status = 'synced' WHERE id = ?",
-                    (alert[0],)
-                )
-
-            conn.commit()
-            conn.close()
+            conn = self._get_connection()
+            # Each table is its own unit: a bad reading must not hold back alerts
+            synced = all([
+                self._sync_pending(
+                    conn, 'weather_data', 'timestamp', location_id,
+                    self._push_weather_data
+                ),
+                self._sync_pending(
+                    conn, 'weather_alerts', 'start_time', location_id,
+                    self._push_alerts
+                ),
+            ])
+            if not synced:
+                return False
 
             # Update last sync time
             cache.set(
@@ -164,6 +359,88 @@ class OfflineDataManager:
             logger.error(f"Error syncing data: {e}")
             return False
 
+    def _sync_pending(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        time_column: str,
+        location_id: int,
+        push
+    ) -> bool:
+        """
+        Push one table's pending rows for a location and mark them synced.
+
+        Server rows are keyed on the offline uuid, so if the process dies
+        after the server commit but before the local rows are marked synced,
+        the retry upserts the same rows instead of duplicating them.
+        """
+        pending = conn.execute(
+            f"SELECT * FROM {table} WHERE location_id = ? AND sync_status = 'pending'",
+            (location_id,)
+        ).fetchall()
+        if not pending:
+            return True
+
+        try:
+            with transaction.atomic():
+                push(pending)
+        except Exception as e:
+            logger.error(f"Error syncing offline {table}: {e}")
+            return False
+
+        # Rows are keyed (location_id, time, id); time is column 5 in both tables
+        with conn:
+            conn.executemany(
+                f"UPDATE {table} SET sync_status = 'synced' "
+                f"WHERE location_id = ? AND {time_column} = ? AND id = ?",
+                ((row[1], row[5], row[0]) for row in pending)
+            )
+        return True
+
+    def _push_weather_data(self, rows: List[tuple]) -> None:
+        """Upsert pending offline readings into WeatherData."""
+        # update_conflicts rather than ignore_conflicts: SQLite's INSERT OR
+        # IGNORE would also swallow NOT NULL failures and lose the rows.
+        WeatherData.objects.bulk_create(
+            (
+                WeatherData(
+                    location_id=data[1],
+                    temperature=data[2],
+                    humidity=data[3],
+                    rainfall=data[4],
+                    timestamp=_from_epoch(data[5]),
+                    data_source=data[6],
+                    offline_id=data[0]
+                )
+                for data in rows
+            ),
+            batch_size=_SYNC_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['offline_id'],
+            update_fields=['temperature', 'humidity', 'rainfall']
+        )
+
+    def _push_alerts(self, rows: List[tuple]) -> None:
+        """Upsert pending offline alerts into WeatherAlert."""
+        WeatherAlert.objects.bulk_create(
+            (
+                WeatherAlert(
+                    location_id=alert[1],
+                    alert_type=alert[2],
+                    severity=alert[3],
+                    description=alert[4],
+                    start_time=_from_epoch(alert[5]),
+                    end_time=_from_epoch(alert[6]),
+                    offline_id=alert[0]
+                )
+                for alert in rows
+            ),
+            batch_size=_SYNC_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['offline_id'],
+            update_fields=['severity', 'description', 'end_time']
+        )
+
     def store_offline_data(
         self,
         location_id: int,
@@ -181,42 +458,43 @@ class OfflineDataManager:
         Returns:
             bool: True if storage was successful
         """
-        try:
-            conn = sqlite3.connect(str(self.offline_db_path))
-            cursor = conn.cursor()
+        return self.store_offline_data_bulk(location_id, data_type, [data])
 
-            if data_type == 'weather_data':
-                cursor.execute("""
-                    INSERT INTO weather_data 
-                    (location_id, temperature, humidity, rainfall, 
-                     timestamp, data_source, sync_status)
-                    VALUES (?, ?, ?, ?, ?, ?, 'pending')
-                """, (
-                    location_id,
-                    data['temperature'],
-                    data['humidity'],
-                    data['rainfall'],
-                    data['timestamp'].isoformat(),
-                    data['data_source']
-                ))
+    def store_offline_data_bulk(
+        self,
+        location_id: int,
+        data_type: str,
+        rows: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Store many records of one data type in a single transaction.
+        
+        Args:
+            location_id: Location ID
+            data_type: Type of data (weather_data, alert)
+            rows: Data dictionaries to store
             
-            elif data_type == 'alert':
-                cursor.execute("""
-                    INSERT INTO weather_alerts
-                    (location_id, alert_type, severity, description,
-                     start_time, end_time, sync_status)
-                    VALUES (?, ?, ?, ?, ?, ?, 'pending')
-                """, (
-                    location_id,
-                    data['alert_type'],
-                    data['severity'],
-                    data['description'],
-                    data['start_time'].isoformat(),
-                    data['end_time'].isoformat()
-                ))
+        Returns:
+            bool: True if storage was successful
+        """
+        if data_type not in _INSERT_SPECS:
+            logger.error(f"Unknown offline data type: {data_type}")
+            return False
 
-            conn.commit()
-            conn.close()
+        columns = _INSERT_SPECS[data_type][1]
+        params = [
+            (
+                uuid.uuid4().hex,
+                location_id,
+                *(_to_sql_value(row[column]) for column in columns)
+            )
+            for row in rows
+        ]
+
+        try:
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(_INSERT_SQL[data_type], params)
             return True
 
         except sqlite3.Error as e:
@@ -228,7 +506,7 @@ class OfflineDataManager:
         location_id: int,
         data_type: str,
         start_date: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[OfflineRow]:
         """
         Retrieve stored offline data.
         
@@ -238,44 +516,25 @@ class OfflineDataManager:
             start_date: Optional start date for data retrieval
             
         Returns:
-            List of data dictionaries
+            List of ``OfflineRow`` dictionaries; time columns are epoch
+            seconds, and ``row.as_datetime()`` gives the datetime
         """
+        if data_type not in _SELECT_SPECS:
+            logger.error(f"Unknown offline data type: {data_type}")
+            return []
+
+        table, time_column, columns = _SELECT_SPECS[data_type]
+        query = f"SELECT {', '.join(columns)} FROM {table} WHERE location_id = ?"
+        params = [location_id]
+        if start_date:
+            query += f" AND {time_column} >= ?"
+            params.append(start_date.timestamp())
+
         try:
-            conn = sqlite3.connect(str(self.offline_db_path))
-            cursor = conn.cursor()
+            conn = self._get_connection()
+            results = conn.execute(query, params).fetchall()
 
-            if data_type == 'weather_data':
-                query = """
-                    SELECT * FROM weather_data 
-                    WHERE location_id = ?
-                """
-                if start_date:
-                    query += " AND timestamp >= ?"
-                    cursor.execute(query, (location_id, start_date.isoformat()))
-                else:
-                    cursor.execute(query, (location_id,))
-                
-                columns = ['id', 'location_id', 'temperature', 'humidity',
-                          'rainfall', 'timestamp', 'data_source', 'sync_status']
-                
-            elif data_type == 'alerts':
-                query = """
-                    SELECT * FROM weather_alerts 
-                    WHERE location_id = ?
-                """
-                if start_date:
-                    query += " AND start_time >= ?"
-                    cursor.execute(query, (location_id, start_date.isoformat()))
-                else:
-                    cursor.execute(query, (location_id,))
-                
-                columns = ['id', 'location_id', 'alert_type', 'severity',
-                          'description', 'start_time', 'end_time', 'sync_status']
-
-            results = cursor.fetchall()
-            conn.close()
-
-            return [dict(zip(columns, row)) for row in results]
+            return [OfflineRow(zip(columns, row), time_column) for row in results]
 
         except sqlite3.Error as e:
             logger.error(f"Error retrieving offline data: {e}")
@@ -286,25 +545,18 @@ class OfflineDataManager:
         try:
             cutoff_date = (
                 timezone.now() - timedelta(days=self.min_storage_days)
-            ).isoformat()
+            ).timestamp()
             
-            conn = sqlite3.connect(str(self.offline_db_path))
+            conn = self._get_connection()
             cursor = conn.cursor()
 
             # Clean up old weather data
-            cursor.execute(
-                "DELETE FROM weather_data WHERE timestamp < ? AND sync_status = 'synced'",
-                (cutoff_date,)
-            )
+            cursor.execute(_CLEANUP_WEATHER_SQL, (cutoff_date,))
 
             # Clean up old alerts
-            cursor.execute(
-                "DELETE FROM weather_alerts WHERE end_time < ? AND sync_status = 'synced'",
-                (cutoff_date,)
-            )
+            cursor.execute(_CLEANUP_ALERTS_SQL, (cutoff_date,))
 
             conn.commit()
-            conn.close()
             logger.info("Old data cleanup completed")
 
         except sqlite3.Error as e:
@@ -313,23 +565,28 @@ class OfflineDataManager:
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get statistics about offline storage usage."""
         try:
-            conn = sqlite3.connect(str(self.offline_db_path))
+            conn = self._get_connection()
             cursor = conn.cursor()
 
+            weather_data_count, pending_sync_count = cursor.execute("""
+                SELECT COUNT(*),
+                       COALESCE(SUM(CASE WHEN sync_status = 'pending' THEN 1 ELSE 0 END), 0)
+                FROM weather_data
+            """).fetchone()
+            alerts_count = cursor.execute(
+                "SELECT COUNT(*) FROM weather_alerts"
+            ).fetchone()[0]
+            page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+            page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+
             stats = {
-                'weather_data_count': cursor.execute(
-                    "SELECT COUNT(*) FROM weather_data"
-                ).fetchone()[0],
-                'alerts_count': cursor.execute(
-                    "SELECT COUNT(*) FROM weather_alerts"
-                ).fetchone()[0],
-                'pending_sync_count': cursor.execute(
-                    "SELECT COUNT(*) FROM weather_data WHERE sync_status = 'pending'"
-                ).fetchone()[0],
-                'storage_size_kb': Path(self.offline_db_path).stat().st_size / 1024
+                'weather_data_count': weather_data_count,
+                'alerts_count': alerts_count,
+                'pending_sync_count': pending_sync_count,
+                # Page-based size also works for ':memory:' databases
+                'storage_size_kb': page_count * page_size / 1024
             }
 
-            conn.close()
             return stats
 
         except sqlite3.Error as e:
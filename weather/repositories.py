@@ -3,8 +3,13 @@ Repository pattern implementation for weather data access.
 Centralizes data access operations and adds a layer of abstraction.
 """
 
+import copy
+import math
+from itertools import chain
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
+import numpy as np
 from django.utils import timezone
 from django.db.models import QuerySet, Avg, Sum, Min, Max, Count, F, Q
 from django.core.cache import cache
@@ -12,6 +17,33 @@ from django.core.cache import cache
 from .models import Location, WeatherData, WeatherForecast, WeatherAlert
 from .exceptions import InvalidLocationError, WeatherDataError
 from .config import WEATHER_CONFIG, TIME_INTERVALS
+from ._numeric import agri_metrics_many, haversine_km_many
+from .signals import get_location_version, location_cache_key
+
+# Rows fetched per round trip when streaming long readings series
+_ITERATOR_CHUNK_SIZE = 500
+
+
+@lru_cache(maxsize=2048)
+def _get_location_cached(location_id: int, version: str) -> Location:
+    """
+    Process-local tier in front of the shared cache.
+
+    Keyed on the location's shared version token, so a save or delete in any
+    worker makes the old entry unreachable everywhere.
+    """
+    cache_key = location_cache_key(location_id)
+    location = cache.get(cache_key)
+
+    if not location:
+        try:
+            location = Location.objects.get(id=location_id)
+            cache.set(cache_key, location, WEATHER_CONFIG['CACHE_TIMEOUT'])
+        except Location.DoesNotExist:
+            raise InvalidLocationError(f"Location with id {location_id} not found")
+
+    return location
+
 
 class WeatherRepository:
     """
@@ -21,17 +53,9 @@ class WeatherRepository:
 
     def get_location(self, location_id: int) -> Optional[Location]:
         """Get a location by ID with caching."""
-        cache_key = f"{WEATHER_CONFIG['CACHE_KEY_PREFIX']}location_{location_id}"
-        location = cache.get(cache_key)
-        
-        if not location:
-            try:
-                location = Location.objects.get(id=location_id)
-                cache.set(cache_key, location, WEATHER_CONFIG['CACHE_TIMEOUT'])
-            except Location.DoesNotExist:
-                raise InvalidLocationError(f"Location with id {location_id} not found")
-        
-        return location
+        location = _get_location_cached(location_id, get_location_version(location_id))
+        # The cached instance is shared by the whole process; hand out copies
+        return copy.copy(location)
 
     def get_current_weather(self, location_id: int) -> Optional[WeatherData]:
         """Get the most recent weather data for a location."""
@@ -79,6 +103,48 @@ class WeatherRepository:
             .order_by('date')
         )
 
+    def get_agricultural_metrics_series(
+        self,
+        location_id: int,
+        days: int = 7
+    ) -> Dict[str, np.ndarray]:
+        """Compute agricultural metrics for every reading in the period at once."""
+        start_date = timezone.now() - timedelta(days=days)
+        # Stream rows straight into the array rather than building a list of
+        # tuples first; iterator() bypasses the queryset cache, so the rows
+        # can only be consumed once.
+        rows = (
+            WeatherData.objects
+            .filter(
+                location_id=location_id,
+                timestamp__gte=start_date,
+                temperature__isnull=False,
+                humidity__isnull=False
+            )
+            .order_by('timestamp')
+            .values_list('temperature', 'humidity')
+            .iterator(chunk_size=_ITERATOR_CHUNK_SIZE)
+        )
+        readings = np.fromiter(
+            chain.from_iterable(rows), dtype=np.float64
+        ).reshape(-1, 2)
+
+        thresholds = WEATHER_CONFIG['ALERT_THRESHOLDS']
+        gdd, frost_risk, heat_stress_risk, disease_risk = agri_metrics_many(
+            readings[:, 0],
+            readings[:, 1],
+            float(WEATHER_CONFIG['GROWING_DEGREE_DAYS']['BASE_TEMPERATURE']),
+            float(thresholds['LOW_TEMPERATURE']),
+            float(thresholds['HIGH_TEMPERATURE']),
+            float(thresholds['HIGH_HUMIDITY'])
+        )
+        return {
+            'growing_degree_days': gdd,
+            'frost_risk': frost_risk,
+            'heat_stress_risk': heat_stress_risk,
+            'disease_risk': disease_risk
+        }
+
     def get_active_alerts(
         self, 
         location_id: int, 
@@ -128,17 +194,48 @@ class WeatherRepository:
         latitude: float, 
         longitude: float, 
         radius_km: float = WEATHER_CONFIG['DEFAULT_RADIUS_KM']
-    ) -> QuerySet:
-        """Get locations within specified radius using Haversine formula."""
-        return Location.objects.raw("""
-            SELECT *, 
-            (6371 * acos(cos(radians(%s)) * cos(radians(latitude))
-            * cos(radians(longitude) - radians(%s)) + sin(radians(%s))
-            * sin(radians(latitude)))) AS distance
-            FROM weather_location
-            HAVING distance < %s
-            ORDER BY distance
-        """, [latitude, longitude, latitude, radius_km])
+    ) -> List[Location]:
+        """
+        Get locations within specified radius, nearest first.
+
+        A lat/lon bounding box is applied in SQL so the (latitude, longitude)
+        index does the coarse filtering; the exact Haversine distance is then
+        computed only for the candidates. Each returned location carries a
+        ``distance`` attribute in km.
+
+        A box that crosses the antimeridian is split into two longitude
+        ranges; one that reaches a pole spans every longitude.
+        """
+        d_lat = radius_km / 111.0
+        d_lon = radius_km / (111.0 * max(math.cos(math.radians(latitude)), 1e-6))
+        query = Q(latitude__range=(latitude - d_lat, latitude + d_lat))
+
+        if abs(latitude) + d_lat < 90 and d_lon < 180:
+            min_lon, max_lon = longitude - d_lon, longitude + d_lon
+            if min_lon < -180:
+                query &= Q(longitude__gte=min_lon + 360) | Q(longitude__lte=max_lon)
+            elif max_lon > 180:
+                query &= Q(longitude__gte=min_lon) | Q(longitude__lte=max_lon - 360)
+            else:
+                query &= Q(longitude__range=(min_lon, max_lon))
+
+        candidates = list(Location.objects.filter(query))
+        if not candidates:
+            return []
+
+        distances = haversine_km_many(
+            float(latitude),
+            float(longitude),
+            np.array([float(loc.latitude) for loc in candidates]),
+            np.array([float(loc.longitude) for loc in candidates])
+        )
+        nearby = []
+        for loc, distance in zip(candidates, distances):
+            if distance < radius_km:
+                loc.distance = float(distance)
+                nearby.append(loc)
+        nearby.sort(key=lambda loc: loc.distance)
+        return nearby
 
     def create_weather_data(self, data: Dict[str, Any]) -> WeatherData:
         """Create new weather data with validation."""
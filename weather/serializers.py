@@ -1,11 +1,11 @@
 from rest_framework import serializers
 from .models import Location, WeatherData, WeatherForecast, WeatherAlert
-from .language_utils import WeatherTranslator
+from .language_utils import get_translator
 
 class LocationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Location
-        fields = ['id', 'name', 'district', 'state', 'latitude', 'longitude', 'elevation']
+        fields = ('id', 'name', 'district', 'state', 'latitude', 'longitude', 'elevation')
 
     def to_representation(self, instance):
         """Add language context to the representation."""
@@ -20,23 +20,24 @@ class WeatherDataSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = WeatherData
-        fields = [
+        fields = (
             'id', 'location', 'location_details', 'temperature', 'humidity',
             'rainfall', 'wind_speed', 'wind_direction', 'soil_temperature',
             'soil_moisture', 'solar_radiation', 'weather_condition', 'localized_weather_condition',
             'timestamp', 'created_at', 'data_source', 'localized_agricultural_metrics'
-        ]
+        )
 
     def get_localized_weather_condition(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
         return translator.get_weather_condition(obj.weather_condition)
 
     def get_localized_agricultural_metrics(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
+        agri = obj.agricultural_metrics
         metrics = {
-            'frost_risk': obj.temperature <= 2,
-            'heat_stress_risk': obj.temperature >= 35,
-            'disease_favorable': obj.humidity >= 80 and obj.temperature >= 20,
+            'frost_risk': agri['frost_risk'],
+            'heat_stress_risk': agri['heat_stress_risk'],
+            'disease_favorable': agri['disease_risk'],
             'soil_condition': translator.get_soil_condition(obj.soil_moisture) if obj.soil_moisture else None
         }
         return metrics
@@ -48,35 +49,27 @@ class WeatherForecastSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = WeatherForecast
-        fields = [
+        fields = (
             'id', 'location', 'location_details', 'forecast_date',
             'min_temperature', 'max_temperature', 'humidity',
             'rainfall_probability', 'expected_rainfall', 'wind_speed',
             'weather_condition', 'localized_weather_condition', 'frost_risk', 'heat_stress_risk',
             'created_at', 'confidence_level', 'localized_agricultural_conditions'
-        ]
+        )
 
     def get_localized_weather_condition(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
         return translator.get_weather_condition(obj.weather_condition)
 
     def get_localized_agricultural_conditions(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
-        avg_temp = (obj.max_temperature + obj.min_temperature) / 2
+        translator = get_translator(self.context.get('language'))
+        conditions = obj.agricultural_conditions
+        action = conditions['irrigation_action']
         return {
-            'growing_conditions': (
-                'favorable' if (15 <= avg_temp <= 30 and 40 <= obj.humidity <= 70)
-                else 'unfavorable'
-            ),
-            'risks': {
-                'frost': obj.min_temperature <= 2,
-                'heat_stress': obj.max_temperature >= 35,
-                'disease': obj.humidity >= 80 and avg_temp >= 20
-            },
+            'growing_conditions': conditions['growing_conditions'],
+            'risks': conditions['risks'],
             'irrigation_recommendation': (
-                translator.get_farming_action('IRRIGATE') if obj.rainfall_probability < 30 else
-                translator.get_farming_action('SPRAY') if obj.rainfall_probability > 70 else
-                'monitor'
+                translator.get_farming_action(action) if action else 'monitor'
             )
         }
 
@@ -89,23 +82,23 @@ class WeatherAlertSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = WeatherAlert
-        fields = [
+        fields = (
             'id', 'location', 'location_details', 'alert_type', 'localized_alert_type',
             'severity', 'description', 'localized_description', 'recommended_actions', 'localized_recommended_actions',
             'start_time', 'end_time', 'created_at', 'is_active', 'affected_crops',
             'resolution_notes', 'actual_impact', 'resolved_at'
-        ]
+        )
 
     def get_localized_alert_type(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
         return translator.get_alert_type(obj.alert_type)
 
     def get_localized_description(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
         return translator.get_alert_type(obj.description)
 
     def get_localized_recommended_actions(self, obj):
-        translator = WeatherTranslator(self.context.get('language'))
+        translator = get_translator(self.context.get('language'))
         return translator.get_farming_action(obj.recommended_actions)
 
 class LocationWeatherSerializer(serializers.Serializer):
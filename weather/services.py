@@ -5,6 +5,7 @@ Implements complex calculations and data processing operations.
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
+import numpy as np
 from django.utils import timezone
 from django.db.models import Avg
 
@@ -13,6 +14,32 @@ from .repositories import WeatherRepository
 from .config import WEATHER_CONFIG
 from .exceptions import WeatherDataError
 
+# Trend labels indexed by sign(diff) + 1
+_TREND_LABELS = ('decreasing', 'stable', 'increasing')
+_TREND_THRESHOLD = 0.1  # threshold for considering trend significant
+
+# Soil classification bins for np.digitize. The upper edge is nudged up so a
+# reading exactly on the high threshold still counts as the middle bucket.
+_MOISTURE_BINS = np.array([
+    WEATHER_CONFIG['ALERT_THRESHOLDS']['LOW_SOIL_MOISTURE'],
+    np.nextafter(WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_SOIL_MOISTURE'], np.inf)
+], dtype=np.float64)
+_MOISTURE_LABELS = ('dry', 'optimal', 'saturated')
+_SOIL_TEMP_BINS = np.array([10.0, np.nextafter(35.0, np.inf)])
+_SOIL_TEMP_LABELS = ('cold', 'optimal', 'hot')
+
+
+def classify_moisture_bulk(values) -> List[str]:
+    """Classify many soil moisture readings in one vectorized call."""
+    indices = np.digitize(np.asarray(values, dtype=np.float64), _MOISTURE_BINS)
+    return [_MOISTURE_LABELS[i] for i in indices]
+
+
+def classify_soil_temperature_bulk(values) -> List[str]:
+    """Classify many soil temperature readings in one vectorized call."""
+    indices = np.digitize(np.asarray(values, dtype=np.float64), _SOIL_TEMP_BINS)
+    return [_SOIL_TEMP_LABELS[i] for i in indices]
+
 class WeatherAnalysisService:
     """Handles weather data analysis and agricultural insights."""
     
@@ -56,11 +83,11 @@ class WeatherAnalysisService:
         days: int = 7
     ) -> Dict[str, Any]:
         """Calculate agricultural metrics for a location."""
-        weather_data = self.repository.get_weather_history(location_id, days)
-        
+        # One query; the trend helpers below all walk this same list
+        weather_data = list(self.repository.get_weather_history(location_id, days))
         if not weather_data:
             raise WeatherDataError("No weather data available")
-            
+
         current = self.repository.get_current_weather(location_id)
         
         metrics = {
@@ -96,11 +123,12 @@ class WeatherAnalysisService:
 
     def _analyze_current_conditions(self, weather: WeatherData) -> Dict[str, Any]:
         """Analyze current weather conditions."""
+        thresholds = WEATHER_CONFIG['ALERT_THRESHOLDS']
         return {
-            'frost_risk': weather.temperature <= WEATHER_CONFIG['ALERT_THRESHOLDS']['LOW_TEMPERATURE'],
-            'heat_stress_risk': weather.temperature >= WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_TEMPERATURE'],
+            'frost_risk': weather.temperature <= thresholds['LOW_TEMPERATURE'],
+            'heat_stress_risk': weather.temperature >= thresholds['HIGH_TEMPERATURE'],
             'disease_risk': (
-                weather.humidity >= WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_HUMIDITY'] and
+                weather.humidity >= thresholds['HIGH_HUMIDITY'] and
                 weather.temperature >= 20
             ),
             'soil_conditions': {
@@ -143,23 +171,13 @@ class WeatherAnalysisService:
         """Assess soil moisture status."""
         if moisture is None:
             return "unknown"
-            
-        if moisture < WEATHER_CONFIG['ALERT_THRESHOLDS']['LOW_SOIL_MOISTURE']:
-            return "dry"
-        if moisture > WEATHER_CONFIG['ALERT_THRESHOLDS']['HIGH_SOIL_MOISTURE']:
-            return "saturated"
-        return "optimal"
+        return _MOISTURE_LABELS[int(np.digitize(moisture, _MOISTURE_BINS))]
 
     def _assess_soil_temperature(self, temperature: Optional[float]) -> str:
         """Assess soil temperature status."""
         if temperature is None:
             return "unknown"
-            
-        if temperature < 10:
-            return "cold"
-        if temperature > 35:
-            return "hot"
-        return "optimal"
+        return _SOIL_TEMP_LABELS[int(np.digitize(temperature, _SOIL_TEMP_BINS))]
 
     def _analyze_temperature_trends(self, weather_data: List[Dict]) -> Dict[str, Any]:
         """Analyze temperature patterns over time."""
@@ -193,14 +211,25 @@ class WeatherAnalysisService:
         """Calculate trend direction from a series of values."""
         if len(values) < 2:
             return "stable"
-            
-        first_half = sum(values[:len(values)//2]) / (len(values)//2)
-        second_half = sum(values[len(values)//2:]) / (len(values) - len(values)//2)
-        
-        diff = second_half - first_half
-        if abs(diff) < 0.1:  # threshold for considering trend significant
-            return "stable"
-        return "increasing" if diff > 0 else "decreasing"
+        return self._trends_batch(np.asarray([values], dtype=np.float64))[0]
+
+    def _trends_batch(self, mat: np.ndarray) -> List[str]:
+        """
+        Calculate trend directions for K equal-length series at once.
+
+        Each row of the K x N matrix is split at N // 2 and both half-sums
+        come from a single np.add.reduceat pass.
+        """
+        n = mat.shape[1]
+        half = n // 2
+        if half == 0:
+            return ["stable"] * mat.shape[0]
+
+        sums = np.add.reduceat(mat, [0, half], axis=1)
+        means = sums / np.array([half, n - half], dtype=np.float64)
+        diff = means[:, 1] - means[:, 0]
+        signs = np.where(np.abs(diff) < _TREND_THRESHOLD, 0, np.sign(diff)).astype(int)
+        return [_TREND_LABELS[sign + 1] for sign in signs]
 
     def _generate_agricultural_alerts(
         self,
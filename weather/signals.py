@@ -0,0 +1,52 @@
+"""
+Signal handlers for the weather module.
+Keeps the location caches in step with writes to Location rows.
+"""
+
+import uuid
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Location
+from .config import WEATHER_CONFIG
+
+
+def location_cache_key(location_id: int) -> str:
+    """Shared-cache key holding a pickled Location."""
+    return f"{WEATHER_CONFIG['CACHE_KEY_PREFIX']}location_{location_id}"
+
+
+def location_version_key(location_id: int) -> str:
+    """Shared-cache key holding a location's current cache version token."""
+    return f"{WEATHER_CONFIG['CACHE_KEY_PREFIX']}location_version_{location_id}"
+
+
+def get_location_version(location_id: int) -> str:
+    """
+    Return the location's current version token, creating one if needed.
+
+    Tokens are random rather than counters, so a cleared or evicted cache
+    can never hand out a token an old in-process entry is still keyed on.
+    The token expires after CACHE_TIMEOUT, which also bounds how long
+    writes that send no signals (QuerySet.update(), bulk_create()) stay
+    invisible.
+    """
+    key = location_version_key(location_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, WEATHER_CONFIG['CACHE_TIMEOUT'])
+        version = cache.get(key)
+    return version
+
+
+@receiver([post_save, post_delete], sender=Location)
+def invalidate_location_cache(sender, instance, **kwargs):
+    """Drop a saved or deleted location from the shared and in-process caches."""
+    cache.delete(location_cache_key(instance.pk))
+    # A new token makes every worker's in-process entry for it unreachable
+    cache.set(
+        location_version_key(instance.pk),
+        uuid.uuid4().hex,
+        WEATHER_CONFIG['CACHE_TIMEOUT']
+    )
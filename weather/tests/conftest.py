@@ -43,22 +43,19 @@ def test_location():
 @pytest.fixture
 def test_weather(test_location):
     """Create test weather data."""
-    weather_data = TEST_WEATHER_DATA.copy()
-    weather_data['location'] = test_location
+    weather_data = {**TEST_WEATHER_DATA, 'location': test_location}
     return WeatherData.objects.create(**weather_data)
 
 @pytest.fixture
 def test_forecast(test_location):
     """Create test weather forecast."""
-    forecast_data = TEST_FORECAST_DATA.copy()
-    forecast_data['location'] = test_location
+    forecast_data = {**TEST_FORECAST_DATA, 'location': test_location}
     return WeatherForecast.objects.create(**forecast_data)
 
 @pytest.fixture
 def test_alert(test_location):
     """Create test weather alert."""
-    alert_data = TEST_ALERT_DATA.copy()
-    alert_data['location'] = test_location
+    alert_data = {**TEST_ALERT_DATA, 'location': test_location}
     return WeatherAlert.objects.create(**alert_data)
 
 @pytest.fixture
@@ -0,0 +1,29 @@
+"""
+Django settings for running the weather test suite.
+Extends the project settings with an in-memory database and no migrations.
+"""
+
+from kisaan_mitra_backend.settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+
+class DisableMigrations:
+    """Build test tables straight from model state instead of migrations."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+# PBKDF2 is deliberately slow; tests only need create_user() to work
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
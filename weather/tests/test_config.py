@@ -3,21 +3,24 @@ Test configuration and utilities for weather application tests.
 """
 
 from decimal import Decimal
+from types import MappingProxyType
 from django.utils import timezone
 from datetime import timedelta
 
+# Shared fixtures are read-only; build per-test dicts with {**TEST_..., ...}
+
 # Test location data
-TEST_LOCATION_DATA = {
+TEST_LOCATION_DATA = MappingProxyType({
     'name': 'Test Village',
     'district': 'Test District',
     'state': 'Haryana',
     'latitude': Decimal('28.7041'),
     'longitude': Decimal('77.1025'),
     'elevation': 216.5
-}
+})
 
 # Test weather data
-TEST_WEATHER_DATA = {
+TEST_WEATHER_DATA = MappingProxyType({
     'temperature': 25.5,
     'humidity': 65.0,
     'rainfall': 0.0,
@@ -29,10 +32,10 @@ TEST_WEATHER_DATA = {
     'weather_condition': 'CLEAR',
     'timestamp': timezone.now(),
     'data_source': 'TEST'
-}
+})
 
 # Test forecast data
-TEST_FORECAST_DATA = {
+TEST_FORECAST_DATA = MappingProxyType({
     'forecast_date': timezone.now().date() + timedelta(days=1),
     'min_temperature': 20.0,
     'max_temperature': 30.0,
@@ -42,20 +45,20 @@ TEST_FORECAST_DATA = {
     'wind_speed': 15.0,
     'weather_condition': 'CLEAR',
     'confidence_level': 80.0
-}
+})
 
 # Test alert data
-TEST_ALERT_DATA = {
+TEST_ALERT_DATA = MappingProxyType({
     'alert_type': 'FROST',
     'severity': 'HIGH',
     'description': 'Test alert',
     'recommended_actions': 'Take protective measures',
     'start_time': timezone.now(),
     'end_time': timezone.now() + timedelta(hours=6)
-}
+})
 
 # Test crop data
-TEST_CROP_DATA = {
+TEST_CROP_DATA = MappingProxyType({
     'name': 'Test Crop',
     'min_temp': 20.0,
     'max_temp': 30.0,
@@ -63,7 +66,7 @@ TEST_CROP_DATA = {
     'max_humidity': 80.0,
     'min_soil_moisture': 30.0,
     'max_soil_moisture': 70.0
-}
+})
 
 def create_test_data_sequence(base_data: dict, days: int, modifier_func=None) -> list:
     """
@@ -72,7 +75,9 @@ def create_test_data_sequence(base_data: dict, days: int, modifier_func=None) ->
     Args:
         base_data: Base dictionary of data
         days: Number of days to generate data for
-        modifier_func: Optional function to modify data for each day
+        modifier_func: Optional function to modify data for each day.
+            It receives a fresh copy of ``base_data`` private to that day,
+            so it may mutate and return it without copying again.
         
     Returns:
         List of modified data dictionaries
@@ -90,8 +95,7 @@ def create_test_data_sequence(base_data: dict, days: int, modifier_func=None) ->
     return data_sequence
 
 def default_weather_modifier(data: dict, day: int) -> dict:
-    """Default modifier for weather data sequence."""
-    data = data.copy()
+    """Default modifier for weather data sequence (mutates ``data`` in place)."""
     data['temperature'] = data['temperature'] + day
     data['humidity'] = min(100, data['humidity'] + day)
     data['rainfall'] = day * 2.0
@@ -2,30 +2,54 @@
 Tests for offline data management functionality.
 """
 
-import os
-import sqlite3
-from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
+from datetime import timedelta
 from unittest.mock import patch, MagicMock
 from django.test import TestCase
 from django.utils import timezone
-from django.core.cache import cache
 
 from ..models import Location, WeatherData, WeatherAlert
-from ..offline_manager import OfflineDataManager
+from ..offline_manager import (
+    OfflineDataManager,
+    _CLEANUP_ALERTS_SQL,
+    _CLEANUP_WEATHER_SQL,
+    _SCHEMA_VERSION
+)
 from ..exceptions import WeatherDataError
 from . import TEST_LOCATION_DATA, TEST_WEATHER_DATA
 
+STRAY_DB_PATH = Path('weather_offline.db')
+
 class OfflineDataManagerTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        STRAY_DB_PATH.unlink(missing_ok=True)
+        # Cache behaviour is irrelevant here; stub it once for the class
+        cls._cache_patch = patch(
+            f'{OfflineDataManager.__module__}.cache',
+            MagicMock(**{'get.return_value': None})
+        )
+        cls._cache_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        STRAY_DB_PATH.unlink(missing_ok=True)
+        cls._cache_patch.stop()
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        # Create test location
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
+
     def setUp(self):
         self.manager = OfflineDataManager()
         
         # Use in-memory SQLite database for testing
         self.manager.offline_db_path = ':memory:'
         
-        # Create test location
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
-        
         # Initialize storage
         self.manager.initialize_offline_storage()
         
@@ -49,16 +73,14 @@ class OfflineDataManagerTests(TestCase):
         }
 
     def tearDown(self):
-        cache.clear()
-        # Clean up any test files
-        if os.path.exists('weather_offline.db'):
-            os.remove('weather_offline.db')
+        self.manager.close()
+        # Tests run against ':memory:'; a file here means something hit disk
+        self.assertFalse(STRAY_DB_PATH.exists())
 
     def test_initialize_storage(self):
         """Test offline storage initialization."""
-        # Connect to the in-memory database
-        conn = sqlite3.connect(':memory:')
-        cursor = conn.cursor()
+        # Inspect the manager's shared in-memory database
+        cursor = self.manager._conn.cursor()
         
         # Check if tables exist
         cursor.execute("""
@@ -72,8 +94,58 @@ class OfflineDataManagerTests(TestCase):
             WHERE type='table' AND name='weather_alerts'
         """)
         self.assertIsNotNone(cursor.fetchone())
-        
-        conn.close()
+
+    def test_initialize_migrates_legacy_tables(self):
+        """Test version 1 tables are rebuilt with their rows preserved."""
+        manager = OfflineDataManager()
+        manager.offline_db_path = ':memory:'
+        self.addCleanup(manager.close)
+        timestamp = timezone.now()
+
+        conn = manager._get_connection()
+        conn.executescript("""
+            CREATE TABLE weather_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                location_id INTEGER NOT NULL,
+                temperature REAL,
+                humidity REAL,
+                rainfall REAL,
+                timestamp TEXT,
+                data_source TEXT,
+                sync_status TEXT
+            );
+            CREATE TABLE weather_alerts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                location_id INTEGER NOT NULL,
+                alert_type TEXT,
+                severity TEXT,
+                description TEXT,
+                start_time TEXT,
+                end_time TEXT,
+                sync_status TEXT
+            );
+        """)
+        with conn:
+            conn.execute(
+                "INSERT INTO weather_data (location_id, temperature, humidity, "
+                "rainfall, timestamp, data_source, sync_status) "
+                "VALUES (?, 25.5, 65.0, 0.0, ?, 'TEST', 'pending')",
+                (self.location.id, timestamp.isoformat())
+            )
+
+        manager.initialize_offline_storage()
+
+        self.assertEqual(
+            conn.execute("PRAGMA user_version").fetchone()[0],
+            _SCHEMA_VERSION
+        )
+        rows = manager.get_offline_data(self.location.id, 'weather_data')
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['sync_status'], 'pending')
+        self.assertAlmostEqual(rows[0]['timestamp'], timestamp.timestamp(), places=2)
+        self.assertTrue(manager.store_offline_data(
+            self.location.id, 'weather_data', self.weather_data
+        ))
 
     def test_store_offline_data(self):
         """Test storing weather data offline."""
@@ -91,9 +163,15 @@ class OfflineDataManagerTests(TestCase):
             'weather_data'
         )
         self.assertEqual(len(stored_data), 1)
-        self.assertEqual(
-            Decimal(str(stored_data[0]['temperature'])),
-            Decimal(str(self.weather_data['temperature']))
+        self.assertAlmostEqual(
+            float(stored_data[0]['temperature']),
+            self.weather_data['temperature'],
+            places=4
+        )
+        self.assertAlmostEqual(
+            stored_data[0].as_datetime(),
+            self.weather_data['timestamp'],
+            delta=timedelta(milliseconds=1)
         )
 
     def test_store_alert_data(self):
@@ -113,12 +191,8 @@ class OfflineDataManagerTests(TestCase):
         self.assertEqual(len(stored_alerts), 1)
         self.assertEqual(stored_alerts[0]['alert_type'], 'FROST')
 
-    @patch('django.core.cache.cache.get')
-    @patch('django.core.cache.cache.set')
-    def test_sync_data(self, mock_cache_set, mock_cache_get):
+    def test_sync_data(self):
         """Test data synchronization."""
-        mock_cache_get.return_value = None
-        
         # Store some test data
         self.manager.store_offline_data(
             self.location.id,
@@ -141,32 +215,72 @@ class OfflineDataManagerTests(TestCase):
         )
         self.assertEqual(stored_data[0]['sync_status'], 'synced')
 
+    def test_sync_data_is_idempotent(self):
+        """Test re-syncing rows the server already has does not duplicate them."""
+        self.manager.store_offline_data(
+            self.location.id,
+            'alert',
+            self.alert_data
+        )
+        self.assertTrue(self.manager.sync_data(self.location.id))
+
+        # Simulate a crash after the server commit, before the local update
+        with self.manager._conn as conn:
+            conn.execute("UPDATE weather_alerts SET sync_status = 'pending'")
+        self.assertTrue(self.manager.sync_data(self.location.id))
+
+        self.assertEqual(
+            WeatherAlert.objects.filter(location=self.location).count(),
+            1
+        )
+
+    def test_sync_data_only_syncs_the_location(self):
+        """Test rows stored for other locations stay pending."""
+        other_location = Location.objects.create(
+            **{**TEST_LOCATION_DATA, 'name': 'Other Village', 'latitude': Decimal('29.0')}
+        )
+        self.manager.store_offline_data(self.location.id, 'alert', self.alert_data)
+        self.manager.store_offline_data(other_location.id, 'alert', self.alert_data)
+
+        self.assertTrue(self.manager.sync_data(self.location.id))
+
+        self.assertFalse(WeatherAlert.objects.filter(location=other_location).exists())
+        stored_alerts = self.manager.get_offline_data(other_location.id, 'alerts')
+        self.assertEqual(stored_alerts[0]['sync_status'], 'pending')
+
+    def test_sync_data_failure_does_not_block_alerts(self):
+        """Test a failing readings batch leaves the alerts batch committed."""
+        self.manager.store_offline_data(self.location.id, 'weather_data', self.weather_data)
+        self.manager.store_offline_data(self.location.id, 'alert', self.alert_data)
+
+        with patch.object(
+            self.manager, '_push_weather_data', side_effect=ValueError('bad row')
+        ):
+            self.assertFalse(self.manager.sync_data(self.location.id))
+
+        self.assertEqual(WeatherAlert.objects.filter(location=self.location).count(), 1)
+        stored_data = self.manager.get_offline_data(self.location.id, 'weather_data')
+        self.assertEqual(stored_data[0]['sync_status'], 'pending')
+
     def test_cleanup_old_data(self):
         """Test cleaning up old offline data."""
         # Store old data
         old_data = self.weather_data.copy()
         old_data['timestamp'] = timezone.now() - timedelta(days=30)
-        self.manager.store_offline_data(
-            self.location.id,
-            'weather_data',
-            old_data
-        )
         
-        # Store recent data
-        self.manager.store_offline_data(
+        # Store old and recent data in one batch
+        self.manager.store_offline_data_bulk(
             self.location.id,
             'weather_data',
-            self.weather_data
+            [old_data, self.weather_data]
         )
         
         # Mark old data as synced
-        conn = sqlite3.connect(':memory:')
-        cursor = conn.cursor()
-        cursor.execute(
+        conn = self.manager._conn
+        conn.execute(
             "UPDATE weather_data SET sync_status = 'synced' WHERE sync_status = 'pending'"
         )
         conn.commit()
-        conn.close()
         
         # Run cleanup
         self.manager.cleanup_old_data()
@@ -177,11 +291,23 @@ class OfflineDataManagerTests(TestCase):
             'weather_data'
         )
         self.assertEqual(len(stored_data), 1)
-        self.assertEqual(
-            datetime.fromisoformat(stored_data[0]['timestamp']).date(),
-            self.weather_data['timestamp'].date()
+        self.assertAlmostEqual(
+            stored_data[0]['timestamp'],
+            self.weather_data['timestamp'].timestamp(),
+            places=3
         )
 
+    def test_cleanup_uses_index(self):
+        """Test that cleanup deletes are index range searches, not scans."""
+        for sql in (_CLEANUP_WEATHER_SQL, _CLEANUP_ALERTS_SQL):
+            plan = self.manager._conn.execute(
+                f"EXPLAIN QUERY PLAN {sql}",
+                (timezone.now().timestamp(),)
+            ).fetchall()
+            details = ' '.join(row[-1] for row in plan)
+            self.assertIn('SEARCH', details)
+            self.assertIn('USING INDEX', details)
+
     def test_get_storage_stats(self):
         """Test getting storage statistics."""
         # Store some test data
@@ -207,32 +333,31 @@ class OfflineDataManagerTests(TestCase):
     def test_error_handling(self):
         """Test error handling in offline operations."""
         # Test invalid data type
-        with self.assertRaises(sqlite3.Error):
-            self.manager.store_offline_data(
-                self.location.id,
-                'invalid_type',
-                {}
-            )
+        self.assertFalse(self.manager.store_offline_data(
+            self.location.id,
+            'invalid_type',
+            {}
+        ))
         
         # Test invalid location ID
         data = self.manager.get_offline_data(999, 'weather_data')
         self.assertEqual(len(data), 0)
 
+        # Test unknown data type on read
+        self.assertEqual(
+            self.manager.get_offline_data(self.location.id, 'invalid_type'),
+            []
+        )
+
     def test_date_filtering(self):
         """Test date-based filtering of offline data."""
         # Store data with different dates
         old_data = self.weather_data.copy()
         old_data['timestamp'] = timezone.now() - timedelta(days=7)
-        self.manager.store_offline_data(
+        self.manager.store_offline_data_bulk(
             self.location.id,
             'weather_data',
-            old_data
-        )
-        
-        self.manager.store_offline_data(
-            self.location.id,
-            'weather_data',
-            self.weather_data
+            [old_data, self.weather_data]
         )
         
         # Get data from last 3 days
@@ -244,7 +369,8 @@ class OfflineDataManagerTests(TestCase):
         )
         
         self.assertEqual(len(filtered_data), 1)
-        self.assertEqual(
-            datetime.fromisoformat(filtered_data[0]['timestamp']).date(),
-            self.weather_data['timestamp'].date()
+        self.assertAlmostEqual(
+            filtered_data[0]['timestamp'],
+            self.weather_data['timestamp'].timestamp(),
+            places=3
         )
\ No newline at end of file
@@ -14,11 +14,13 @@ from ..exceptions import InvalidLocationError
 from ..config import WEATHER_CONFIG
 
 class WeatherRepositoryTests(TestCase):
-    def setUp(self):
-        self.repository = WeatherRepository()
-        
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        today = now.date()
+
         # Create test location
-        self.location = Location.objects.create(
+        cls.location = Location.objects.create(
             name='Test Village',
             district='Test District',
             state='Haryana',
@@ -26,26 +28,39 @@ class WeatherRepositoryTests(TestCase):
             longitude=Decimal('77.1025')
         )
         
-        # Create test weather data
-        self.weather = WeatherData.objects.create(
-            location=self.location,
-            temperature=25.5,
-            humidity=65.0,
-            rainfall=0.0,
-            wind_speed=10.5,
-            wind_direction=180,
-            soil_temperature=22.5,
-            soil_moisture=45.0,
-            solar_radiation=850.0,
-            weather_condition='CLEAR',
-            timestamp=timezone.now(),
-            data_source='TEST'
-        )
+        # Create current and historical weather data in one round trip
+        cls.weather, cls.old_weather = WeatherData.objects.bulk_create([
+            WeatherData(
+                location=cls.location,
+                temperature=25.5,
+                humidity=65.0,
+                rainfall=0.0,
+                wind_speed=10.5,
+                wind_direction=180,
+                soil_temperature=22.5,
+                soil_moisture=45.0,
+                solar_radiation=850.0,
+                weather_condition='CLEAR',
+                timestamp=now,
+                data_source='TEST'
+            ),
+            WeatherData(
+                location=cls.location,
+                temperature=24.0,
+                humidity=60.0,
+                rainfall=10.0,
+                wind_speed=12.0,
+                wind_direction=90,
+                weather_condition='RAIN',
+                timestamp=now - timedelta(days=2),
+                data_source='TEST'
+            ),
+        ])
         
         # Create test forecast
-        self.forecast = WeatherForecast.objects.create(
-            location=self.location,
-            forecast_date=timezone.now().date() + timedelta(days=1),
+        cls.forecast = WeatherForecast.objects.create(
+            location=cls.location,
+            forecast_date=today + timedelta(days=1),
             min_temperature=20.0,
             max_temperature=30.0,
             humidity=65.0,
@@ -57,16 +72,19 @@ class WeatherRepositoryTests(TestCase):
         )
         
         # Create test alert
-        self.alert = WeatherAlert.objects.create(
-            location=self.location,
+        cls.alert = WeatherAlert.objects.create(
+            location=cls.location,
             alert_type='FROST',
             severity='HIGH',
             description='Test alert',
             recommended_actions='Take protective measures',
-            start_time=timezone.now(),
-            end_time=timezone.now() + timedelta(hours=6)
+            start_time=now,
+            end_time=now + timedelta(hours=6)
         )
 
+    def setUp(self):
+        self.repository = WeatherRepository()
+
     def tearDown(self):
         cache.clear()
 
@@ -83,6 +101,23 @@ class WeatherRepositoryTests(TestCase):
         with self.assertRaises(InvalidLocationError):
             self.repository.get_location(999)  # Non-existent ID
 
+    def test_get_location_cache_invalidation(self):
+        """Test cached locations are copies and are refreshed on save."""
+        location = self.repository.get_location(self.location.id)
+        location.name = 'Changed In Memory'
+        self.assertEqual(
+            self.repository.get_location(self.location.id).name,
+            self.location.name
+        )
+
+        renamed = Location.objects.get(id=self.location.id)
+        renamed.name = 'Renamed Village'
+        renamed.save()
+        self.assertEqual(
+            self.repository.get_location(self.location.id).name,
+            'Renamed Village'
+        )
+
     def test_get_current_weather(self):
         """Test retrieving current weather data."""
         weather = self.repository.get_current_weather(self.location.id)
@@ -96,25 +131,26 @@ class WeatherRepositoryTests(TestCase):
 
     def test_get_weather_history(self):
         """Test retrieving historical weather data."""
-        # Create some historical data
-        old_weather = WeatherData.objects.create(
-            location=self.location,
-            temperature=24.0,
-            humidity=60.0,
-            rainfall=10.0,
-            wind_speed=12.0,
-            wind_direction=90,
-            weather_condition='RAIN',
-            timestamp=timezone.now() - timedelta(days=2),
-            data_source='TEST'
-        )
-        
+        # Current and two-day-old records both come from setUpTestData
         history = self.repository.get_weather_history(
             self.location.id,
             days=3
         )
         self.assertEqual(len(history), 2)  # Should include both records
 
+    def test_get_agricultural_metrics_series(self):
+        """Test the batch metrics match the per-reading model method."""
+        series = self.repository.get_agricultural_metrics_series(
+            self.location.id,
+            days=3
+        )
+
+        # Oldest first, matching the timestamp ordering
+        for i, weather in enumerate([self.old_weather, self.weather]):
+            expected = weather.get_agricultural_metrics()
+            for key, values in series.items():
+                self.assertEqual(values[i], expected[key])
+
     def test_get_active_alerts(self):
         """Test retrieving active alerts."""
         alerts = self.repository.get_active_alerts(self.location.id)
@@ -141,23 +177,23 @@ class WeatherRepositoryTests(TestCase):
 
     def test_get_nearby_locations(self):
         """Test finding nearby locations."""
-        # Create another location ~10km away
-        nearby_location = Location.objects.create(
-            name='Nearby Village',
-            district='Test District',
-            state='Haryana',
-            latitude=Decimal('28.7941'),  # ~10km north
-            longitude=Decimal('77.1025')
-        )
-        
-        # Create a far location
-        far_location = Location.objects.create(
-            name='Far Village',
-            district='Test District',
-            state='Haryana',
-            latitude=Decimal('29.7041'),  # ~100km north
-            longitude=Decimal('77.1025')
-        )
+        # Create a location ~10km away and a far one in one round trip
+        nearby_location, far_location = Location.objects.bulk_create([
+            Location(
+                name='Nearby Village',
+                district='Test District',
+                state='Haryana',
+                latitude=Decimal('28.7941'),  # ~10km north
+                longitude=Decimal('77.1025')
+            ),
+            Location(
+                name='Far Village',
+                district='Test District',
+                state='Haryana',
+                latitude=Decimal('29.7041'),  # ~100km north
+                longitude=Decimal('77.1025')
+            ),
+        ])
         
         locations = list(self.repository.get_nearby_locations(
             float(self.location.latitude),
@@ -170,6 +206,58 @@ class WeatherRepositoryTests(TestCase):
         self.assertIn(nearby_location, locations)
         self.assertNotIn(far_location, locations)
 
+    def test_get_nearby_locations_excludes_box_corners(self):
+        """Test the bounding box is only a pre-filter for the radius check."""
+        # Inside the 15km lat/lon box but ~17km away diagonally
+        corner_location, closer_location = Location.objects.bulk_create([
+            Location(
+                name='Corner Village',
+                district='Test District',
+                state='Haryana',
+                latitude=Decimal('28.8241'),
+                longitude=Decimal('77.2225')
+            ),
+            Location(
+                name='Closer Village',
+                district='Test District',
+                state='Haryana',
+                latitude=Decimal('28.7141'),
+                longitude=Decimal('77.1025')
+            ),
+        ])
+
+        locations = self.repository.get_nearby_locations(
+            float(self.location.latitude),
+            float(self.location.longitude),
+            radius_km=15
+        )
+
+        self.assertNotIn(corner_location, locations)
+        self.assertEqual(locations, [self.location, closer_location])
+
+    def test_get_nearby_locations_across_antimeridian(self):
+        """Test the bounding box wraps around longitude +/-180."""
+        east_location, west_location = Location.objects.bulk_create([
+            Location(
+                name='East Island',
+                district='Test District',
+                state='Fiji',
+                latitude=Decimal('-16.5'),
+                longitude=Decimal('179.95')
+            ),
+            Location(
+                name='West Island',
+                district='Test District',
+                state='Fiji',
+                latitude=Decimal('-16.5'),
+                longitude=Decimal('-179.95')  # ~11km east across the line
+            ),
+        ])
+
+        locations = self.repository.get_nearby_locations(-16.5, 179.95, radius_km=15)
+
+        self.assertEqual(locations, [east_location, west_location])
+
     def test_create_weather_data(self):
         """Test creating new weather data."""
         new_data = {
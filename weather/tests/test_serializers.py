@@ -25,6 +25,10 @@ from . import (
 )
 
 class LocationSerializerTests(TestCase):
+    # Coordinates as the serializer renders them (model uses 6 decimal places)
+    _LAT = TEST_LOCATION_DATA['latitude'].quantize(Decimal('0.000001'))
+    _LON = TEST_LOCATION_DATA['longitude'].quantize(Decimal('0.000001'))
+
     def test_serialization(self):
         """Test location serialization."""
         location = Location.objects.create(**TEST_LOCATION_DATA)
@@ -34,25 +38,24 @@ class LocationSerializerTests(TestCase):
         self.assertEqual(data['name'], TEST_LOCATION_DATA['name'])
         self.assertEqual(data['district'], TEST_LOCATION_DATA['district'])
         self.assertEqual(data['state'], TEST_LOCATION_DATA['state'])
-        self.assertEqual(Decimal(data['latitude']), TEST_LOCATION_DATA['latitude'])
-        self.assertEqual(Decimal(data['longitude']), TEST_LOCATION_DATA['longitude'])
+        self.assertEqual(data['latitude'], str(self._LAT))
+        self.assertEqual(data['longitude'], str(self._LON))
 
     def test_validation(self):
         """Test location data validation."""
         # Test invalid coordinates
-        invalid_data = TEST_LOCATION_DATA.copy()
-        invalid_data['latitude'] = 91  # Invalid latitude
+        invalid_data = {**TEST_LOCATION_DATA, 'latitude': 91}  # Invalid latitude
         
         serializer = LocationSerializer(data=invalid_data)
         self.assertFalse(serializer.is_valid())
         self.assertIn('latitude', serializer.errors)
 
 class WeatherDataSerializerTests(TestCase):
-    def setUp(self):
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
-        self.weather_data = TEST_WEATHER_DATA.copy()
-        self.weather_data['location'] = self.location
-        self.weather = WeatherData.objects.create(**self.weather_data)
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
+        cls.weather_data = {**TEST_WEATHER_DATA, 'location': cls.location}
+        cls.weather = WeatherData.objects.create(**cls.weather_data)
 
     def test_serialization(self):
         """Test weather data serialization."""
@@ -69,17 +72,17 @@ class WeatherDataSerializerTests(TestCase):
         serializer = WeatherDataSerializer(self.weather)
         metrics = serializer.data['agricultural_metrics']
         
-        self.assertIn('frost_risk', metrics)
-        self.assertIn('heat_stress_risk', metrics)
-        self.assertIn('disease_favorable', metrics)
-        self.assertIn('soil_condition', metrics)
+        self.assertLessEqual(
+            {'frost_risk', 'heat_stress_risk', 'disease_favorable', 'soil_condition'},
+            set(metrics.keys())
+        )
 
 class WeatherForecastSerializerTests(TestCase):
-    def setUp(self):
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
-        self.forecast_data = TEST_FORECAST_DATA.copy()
-        self.forecast_data['location'] = self.location
-        self.forecast = WeatherForecast.objects.create(**self.forecast_data)
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
+        cls.forecast_data = {**TEST_FORECAST_DATA, 'location': cls.location}
+        cls.forecast = WeatherForecast.objects.create(**cls.forecast_data)
 
     def test_serialization(self):
         """Test forecast serialization."""
@@ -96,16 +99,17 @@ class WeatherForecastSerializerTests(TestCase):
         serializer = WeatherForecastSerializer(self.forecast)
         conditions = serializer.data['agricultural_conditions']
         
-        self.assertIn('growing_conditions', conditions)
-        self.assertIn('risks', conditions)
-        self.assertIn('irrigation_recommendation', conditions)
+        self.assertLessEqual(
+            {'growing_conditions', 'risks', 'irrigation_recommendation'},
+            set(conditions.keys())
+        )
 
 class WeatherAlertSerializerTests(TestCase):
-    def setUp(self):
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
-        self.alert_data = TEST_ALERT_DATA.copy()
-        self.alert_data['location'] = self.location
-        self.alert = WeatherAlert.objects.create(**self.alert_data)
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
+        cls.alert_data = {**TEST_ALERT_DATA, 'location': cls.location}
+        cls.alert = WeatherAlert.objects.create(**cls.alert_data)
 
     def test_serialization(self):
         """Test alert serialization."""
@@ -127,23 +131,21 @@ class WeatherAlertSerializerTests(TestCase):
         self.assertIn(crop.name, serializer.data['affected_crops'])
 
 class LocationWeatherSerializerTests(TestCase):
-    def setUp(self):
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
         
         # Create current weather
-        weather_data = TEST_WEATHER_DATA.copy()
-        weather_data['location'] = self.location
-        self.weather = WeatherData.objects.create(**weather_data)
+        weather_data = {**TEST_WEATHER_DATA, 'location': cls.location}
+        cls.weather = WeatherData.objects.create(**weather_data)
         
         # Create forecast
-        forecast_data = TEST_FORECAST_DATA.copy()
-        forecast_data['location'] = self.location
-        self.forecast = WeatherForecast.objects.create(**forecast_data)
+        forecast_data = {**TEST_FORECAST_DATA, 'location': cls.location}
+        cls.forecast = WeatherForecast.objects.create(**forecast_data)
         
         # Create alert
-        alert_data = TEST_ALERT_DATA.copy()
-        alert_data['location'] = self.location
-        self.alert = WeatherAlert.objects.create(**alert_data)
+        alert_data = {**TEST_ALERT_DATA, 'location': cls.location}
+        cls.alert = WeatherAlert.objects.create(**alert_data)
 
     def test_comprehensive_serialization(self):
         """Test comprehensive weather information serialization."""
@@ -165,9 +167,10 @@ class LocationWeatherSerializerTests(TestCase):
         serializer = LocationWeatherSerializer(data)
         serialized_data = serializer.data
         
-        self.assertIn('location', serialized_data)
-        self.assertIn('current_weather', serialized_data)
-        self.assertIn('forecasts', serialized_data)
-        self.assertIn('active_alerts', serialized_data)
-        self.assertIn('historical_context', serialized_data)
-        self.assertIn('agricultural_summary', serialized_data)
\ No newline at end of file
+        self.assertLessEqual(
+            {
+                'location', 'current_weather', 'forecasts', 'active_alerts',
+                'historical_context', 'agricultural_summary'
+            },
+            set(serialized_data.keys())
+        )
\ No newline at end of file
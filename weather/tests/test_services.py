@@ -7,17 +7,22 @@ from django.test import TestCase
 from django.utils import timezone
 from datetime import timedelta
 
+from crops.models import Crop
+
 from ..models import Location, WeatherData, WeatherForecast, WeatherAlert
 from ..services import WeatherAnalysisService
 from ..config import WEATHER_CONFIG
 from ..exceptions import WeatherDataError
+from . import TEST_CROP_DATA
 
 class WeatherAnalysisServiceTests(TestCase):
-    def setUp(self):
-        self.service = WeatherAnalysisService()
-        
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        today = now.date()
+
         # Create test location
-        self.location = Location.objects.create(
+        cls.location = Location.objects.create(
             name='Test Village',
             district='Test District',
             state='Haryana',
@@ -26,8 +31,8 @@ class WeatherAnalysisServiceTests(TestCase):
         )
         
         # Create test weather data
-        self.current_weather = WeatherData.objects.create(
-            location=self.location,
+        cls.current_weather = WeatherData.objects.create(
+            location=cls.location,
             temperature=25.5,
             humidity=65.0,
             rainfall=0.0,
@@ -37,14 +42,14 @@ class WeatherAnalysisServiceTests(TestCase):
             soil_moisture=45.0,
             solar_radiation=850.0,
             weather_condition='CLEAR',
-            timestamp=timezone.now(),
+            timestamp=now,
             data_source='TEST'
         )
         
-        # Create historical weather data
-        for i in range(7):
-            WeatherData.objects.create(
-                location=self.location,
+        # Create historical weather data in one INSERT
+        WeatherData.objects.bulk_create([
+            WeatherData(
+                location=cls.location,
                 temperature=25.0 + i,
                 humidity=60.0 + i,
                 rainfall=i * 2.0,
@@ -53,14 +58,16 @@ class WeatherAnalysisServiceTests(TestCase):
                 soil_temperature=22.0 + i,
                 soil_moisture=40.0 + i,
                 weather_condition='CLEAR',
-                timestamp=timezone.now() - timedelta(days=i),
+                timestamp=now - timedelta(days=i),
                 data_source='TEST'
             )
+            for i in range(7)
+        ])
         
         # Create test forecast
-        self.forecast = WeatherForecast.objects.create(
-            location=self.location,
-            forecast_date=timezone.now().date() + timedelta(days=1),
+        cls.forecast = WeatherForecast.objects.create(
+            location=cls.location,
+            forecast_date=today + timedelta(days=1),
             min_temperature=20.0,
             max_temperature=30.0,
             humidity=65.0,
@@ -71,6 +78,9 @@ class WeatherAnalysisServiceTests(TestCase):
             confidence_level=80.0
         )
 
+    def setUp(self):
+        self.service = WeatherAnalysisService()
+
     def test_calculate_growing_degree_days(self):
         """Test GDD calculation with different temperatures."""
         base_temp = WEATHER_CONFIG['GROWING_DEGREE_DAYS']['BASE_TEMPERATURE']
@@ -89,19 +99,8 @@ class WeatherAnalysisServiceTests(TestCase):
 
     def test_assess_crop_suitability(self):
         """Test crop suitability assessment."""
-        from crops.models import Crop
-        
-        # Create test crop
-        crop = Crop.objects.create(
-            name='Test Crop',
-            min_temp=20.0,
-            max_temp=30.0,
-            min_humidity=50.0,
-            max_humidity=80.0,
-            min_soil_moisture=30.0,
-            max_soil_moisture=70.0
-        )
-        
+        crop = Crop.objects.create(**TEST_CROP_DATA)
+
         assessment = self.service.assess_crop_suitability(
             self.current_weather,
             crop
@@ -112,8 +111,9 @@ class WeatherAnalysisServiceTests(TestCase):
         self.assertIn('soil_moisture_suitable', assessment)
         self.assertIn('risk_factors', assessment)
         
-        # Test with unsuitable conditions
-        unsuitable_weather = WeatherData.objects.create(
+        # Test with unsuitable conditions; the service only reads attributes,
+        # so the instance does not need to be saved
+        unsuitable_weather = WeatherData(
             location=self.location,
             temperature=35.0,  # Too hot
             humidity=90.0,  # Too humid
@@ -150,8 +150,8 @@ class WeatherAnalysisServiceTests(TestCase):
         self.assertIn('disease_risk', current)
         self.assertIn('soil_conditions', current)
         
-        # Test with no weather data
-        WeatherData.objects.all().delete()
+        # Test with no weather data; the test transaction rolls this back
+        WeatherData.objects.filter(location_id=self.location.id).delete()
         with self.assertRaises(WeatherDataError):
             self.service.get_agricultural_metrics(self.location.id)
 
@@ -164,15 +164,7 @@ class WeatherAnalysisServiceTests(TestCase):
         self.assertIn('recommendations', analysis)
         
         # Test with crop-specific analysis
-        from crops.models import Crop
-        crop = Crop.objects.create(
-            name='Test Crop',
-            min_temp=20.0,
-            max_temp=30.0,
-            min_humidity=50.0,
-            max_humidity=80.0
-        )
-        
+        crop = Crop.objects.create(**TEST_CROP_DATA)
         analysis = self.service.analyze_forecast_implications(
             self.forecast,
             crop_id=crop.id
@@ -180,8 +172,8 @@ class WeatherAnalysisServiceTests(TestCase):
         
         self.assertIn('crop_specific', analysis)
         
-        # Test with extreme conditions
-        extreme_forecast = WeatherForecast.objects.create(
+        # Test with extreme conditions (unsaved; only attributes are read)
+        extreme_forecast = WeatherForecast(
             location=self.location,
             forecast_date=timezone.now().date() + timedelta(days=1),
             min_temperature=0.0,  # Very cold
@@ -3,8 +3,10 @@ Tests for weather application views.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 from django.test import TestCase
 from django.urls import reverse
+from django.core.cache import cache
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
@@ -22,39 +24,56 @@ from . import (
 
 User = get_user_model()
 
+# Query budgets for list endpoints; a higher count means an N+1 crept in
+EXPECTED_LIST_QUERIES = 1
+EXPECTED_ALERT_LIST_QUERIES = 2  # alerts + prefetched affected_crops
+
+@lru_cache(maxsize=None)
+def _url(name: str, **kwargs) -> str:
+    """Reverse a URL name once; the router's URL map is static for the suite."""
+    return reverse(name, kwargs=kwargs or None)
+
 class WeatherViewsTestCase(APITestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.user)
         
         # Create test location
-        self.location = Location.objects.create(**TEST_LOCATION_DATA)
+        cls.location = Location.objects.create(**TEST_LOCATION_DATA)
         
         # Create test weather data
-        weather_data = TEST_WEATHER_DATA.copy()
-        weather_data['location'] = self.location
-        self.weather = WeatherData.objects.create(**weather_data)
+        cls.weather = WeatherData.objects.create(
+            **TEST_WEATHER_DATA, location=cls.location
+        )
         
         # Create test forecast
-        forecast_data = TEST_FORECAST_DATA.copy()
-        forecast_data['location'] = self.location
-        self.forecast = WeatherForecast.objects.create(**forecast_data)
+        cls.forecast = WeatherForecast.objects.create(
+            **TEST_FORECAST_DATA, location=cls.location
+        )
         
         # Create test alert
-        alert_data = TEST_ALERT_DATA.copy()
-        alert_data['location'] = self.location
-        self.alert = WeatherAlert.objects.create(**alert_data)
+        cls.alert = WeatherAlert.objects.create(
+            **TEST_ALERT_DATA, location=cls.location
+        )
+
+    def setUp(self):
+        # APITestCase already provides a fresh APIClient per test
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self):
+        # Location lookups are cached; don't leak them into the next test
+        cache.clear()
 
 class LocationViewSetTests(WeatherViewsTestCase):
     def test_list_locations(self):
         """Test retrieving location list."""
-        url = reverse('location-list')
-        response = self.client.get(url)
+        url = _url('location-list')
+        with self.assertNumQueries(EXPECTED_LIST_QUERIES):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
@@ -62,7 +81,7 @@ class LocationViewSetTests(WeatherViewsTestCase):
 
     def test_create_location(self):
         """Test creating a new location."""
-        url = reverse('location-list')
+        url = _url('location-list')
         new_location_data = {
             'name': 'New Village',
             'district': 'New District',
@@ -75,6 +94,17 @@ class LocationViewSetTests(WeatherViewsTestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Location.objects.count(), 2)
 
+    def test_retrieve_location(self):
+        """Test repeated retrieval is served from the location cache."""
+        url = _url('location-detail', pk=self.location.pk)
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], self.location.name)
+
     def test_nearby_locations(self):
         """Test finding nearby locations."""
         # Create another location ~10km away
@@ -86,7 +116,7 @@ class LocationViewSetTests(WeatherViewsTestCase):
             longitude=Decimal('77.1025')
         )
         
-        url = reverse('location-nearby')
+        url = _url('location-nearby')
         response = self.client.get(url, {
             'latitude': str(self.location.latitude),
             'longitude': str(self.location.longitude),
@@ -96,24 +126,48 @@ class LocationViewSetTests(WeatherViewsTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
 
+    def test_nearby_locations_invalid_coordinates(self):
+        """Test non-numeric coordinates are rejected."""
+        url = _url('location-nearby')
+        response = self.client.get(url, {
+            'latitude': 'north',
+            'longitude': str(self.location.longitude)
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 class WeatherDataViewSetTests(WeatherViewsTestCase):
     def test_list_weather_data(self):
         """Test retrieving weather data list."""
-        url = reverse('weatherdata-list')
-        response = self.client.get(url)
+        url = _url('weatherdata-list')
+        with self.assertNumQueries(EXPECTED_LIST_QUERIES):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
     def test_current_weather(self):
         """Test retrieving current weather."""
-        url = reverse('weatherdata-current')
+        url = _url('weatherdata-current')
         response = self.client.get(url, {'location_id': self.location.id})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['temperature'], self.weather.temperature)
         self.assertIn('agricultural_metrics', response.data)
 
+    def test_agricultural_metrics_uses_latest_reading(self):
+        """Test agricultural metrics with several readings for a location."""
+        WeatherData.objects.create(
+            **{**TEST_WEATHER_DATA, 'timestamp': self.weather.timestamp - timedelta(hours=1)},
+            location=self.location
+        )
+
+        url = _url('weatherdata-agricultural-metrics')
+        response = self.client.get(url, {'location_id': self.location.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.weather.id)
+
     def test_historical_weather(self):
         """Test retrieving historical weather data."""
         # Create historical data
@@ -121,11 +175,12 @@ class WeatherDataViewSetTests(WeatherViewsTestCase):
             TEST_WEATHER_DATA,
             days=7
         )
-        for data in weather_sequence:
-            data['location'] = self.location
-            WeatherData.objects.create(**data)
+        WeatherData.objects.bulk_create(
+            WeatherData(**data, location=self.location)
+            for data in weather_sequence
+        )
             
-        url = reverse('weatherdata-historical')
+        url = _url('weatherdata-historical')
         response = self.client.get(url, {
             'location_id': self.location.id,
             'days': 7
@@ -138,18 +193,20 @@ class WeatherDataViewSetTests(WeatherViewsTestCase):
 class WeatherForecastViewSetTests(WeatherViewsTestCase):
     def test_list_forecasts(self):
         """Test retrieving forecast list."""
-        url = reverse('weatherforecast-list')
-        response = self.client.get(url)
+        url = _url('weatherforecast-list')
+        with self.assertNumQueries(EXPECTED_LIST_QUERIES):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
     def test_weekly_forecast(self):
         """Test retrieving weekly forecast."""
-        url = reverse('weatherforecast-weekly')
-        response = self.client.get(url, {
-            'location_id': self.location.id
-        })
+        url = _url('weatherforecast-weekly')
+        with self.assertNumQueries(EXPECTED_LIST_QUERIES):
+            response = self.client.get(url, {
+                'location_id': self.location.id
+            })
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(len(response.data) > 0)
@@ -162,11 +219,12 @@ class WeatherForecastViewSetTests(WeatherViewsTestCase):
             TEST_FORECAST_DATA,
             days=30
         )
-        for data in forecast_sequence:
-            data['location'] = self.location
-            WeatherForecast.objects.create(**data)
+        WeatherForecast.objects.bulk_create(
+            WeatherForecast(**data, location=self.location)
+            for data in forecast_sequence
+        )
             
-        url = reverse('weatherforecast-monthly-outlook')
+        url = _url('weatherforecast-monthly-outlook')
         response = self.client.get(url, {
             'location_id': self.location.id
         })
@@ -178,15 +236,16 @@ class WeatherForecastViewSetTests(WeatherViewsTestCase):
 class WeatherAlertViewSetTests(WeatherViewsTestCase):
     def test_list_alerts(self):
         """Test retrieving alert list."""
-        url = reverse('weatheralert-list')
-        response = self.client.get(url)
+        url = _url('weatheralert-list')
+        with self.assertNumQueries(EXPECTED_ALERT_LIST_QUERIES):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
     def test_active_alerts(self):
         """Test retrieving active alerts."""
-        url = reverse('weatheralert-active')
+        url = _url('weatheralert-active')
         response = self.client.get(url, {
             'location_id': self.location.id
         })
@@ -197,7 +256,7 @@ class WeatherAlertViewSetTests(WeatherViewsTestCase):
 
     def test_resolve_alert(self):
         """Test resolving an alert."""
-        url = reverse('weatheralert-resolve', kwargs={'pk': self.alert.pk})
+        url = _url('weatheralert-resolve', pk=self.alert.pk)
         response = self.client.post(url, {
             'resolution_notes': 'Test resolution',
             'actual_impact': 'Minimal impact'
@@ -207,10 +266,33 @@ class WeatherAlertViewSetTests(WeatherViewsTestCase):
         self.alert.refresh_from_db()
         self.assertFalse(self.alert.is_active)
 
+    def test_alert_statistics(self):
+        """Test alert statistics use one aggregate plus the crop ranking."""
+        url = _url('weatheralert-statistics')
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {
+                'location_id': self.location.id
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_alerts'], 1)
+        self.assertEqual(
+            response.data['by_severity'],
+            [{'severity': 'HIGH', 'count': 1}]
+        )
+        self.assertEqual(
+            response.data['by_type'],
+            [{'alert_type': 'FROST', 'count': 1}]
+        )
+
 class LocationWeatherViewSetTests(WeatherViewsTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_comprehensive_weather_info(self):
         """Test retrieving comprehensive weather information."""
-        url = reverse('location-weather-list')
+        url = _url('location-weather-list')
         response = self.client.get(url, {
             'location_id': self.location.id
         })
@@ -221,10 +303,23 @@ class LocationWeatherViewSetTests(WeatherViewsTestCase):
         self.assertIn('forecasts', response.data)
         self.assertIn('active_alerts', response.data)
         self.assertIn('agricultural_summary', response.data)
+        self.assertIn('max-age', response['Cache-Control'])
+
+    def test_response_is_cached(self):
+        """Test repeated requests are served from the cache."""
+        url = _url('location-weather-list')
+        params = {'location_id': self.location.id}
+        first = self.client.get(url, params)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url, params)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data, first.data)
 
     def test_error_handling(self):
         """Test error handling for invalid location."""
-        url = reverse('location-weather-list')
+        url = _url('location-weather-list')
         response = self.client.get(url, {
             'location_id': 999  # Non-existent location
         })
@@ -232,9 +327,10 @@ class LocationWeatherViewSetTests(WeatherViewsTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 class AuthenticationTests(TestCase):
+    client_class = APIClient
+
     def setUp(self):
-        self.client = APIClient()
-        self.url = reverse('weatherdata-list')
+        self.url = _url('weatherdata-list')
 
     def test_authentication_required(self):
         """Test that authentication is required for API access."""
@@ -1,8 +1,8 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from . import views
 
-router = DefaultRouter()
+router = SimpleRouter(trailing_slash=True)
 router.register(r'locations', views.LocationViewSet)
 router.register(r'weather-data', views.WeatherDataViewSet)
 router.register(r'forecasts', views.WeatherForecastViewSet)
@@ -2,13 +2,27 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from django.utils import timezone
-from django.db.models import Avg, Sum, Count, Q, F, Min, Max
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.core.cache import cache
+from django.db.models import (
+    Avg, Sum, Count, Q, F, Min, Max, Case, When, Value, BooleanField, FloatField,
+    ExpressionWrapper
+)
 from django.db.models.functions import Extract
 from django.contrib.postgres.aggregates import ArrayAgg
+from collections import Counter
 from datetime import timedelta
-from decimal import Decimal
+import time
+
+try:
+    from drf_orjson_renderer.renderers import ORJSONRenderer as JSONRenderer
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    from rest_framework.renderers import JSONRenderer
 
+from crops.models import Crop
 from .models import Location, WeatherData, WeatherForecast, WeatherAlert
 from .serializers import (
     LocationSerializer,
@@ -19,30 +33,84 @@ from .serializers import (
     WeatherStatsSerializer,
     HistoricalWeatherSerializer
 )
-from .language_utils import WeatherTranslator
+from .language_utils import get_translator
 from .repositories import WeatherRepository
 from .config import WEATHER_CONFIG
 from .exceptions import InvalidLocationError, WeatherDataError
 
-class LocationViewSet(viewsets.ModelViewSet):
+
+def _flag(condition: Q) -> Case:
+    """Boolean SQL expression that is True when ``condition`` holds."""
+    return Case(
+        When(condition, then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField()
+    )
+
+
+# Columns read by the location weather summary and its serializers
+LOCATION_FIELDS = ('id', 'name', 'district', 'state', 'latitude', 'longitude', 'elevation')
+_RELATED_LOCATION_FIELDS = tuple(f'location__{field}' for field in LOCATION_FIELDS)
+WEATHER_FIELDS = (
+    'id', 'location', 'temperature', 'humidity', 'rainfall', 'wind_speed',
+    'wind_direction', 'soil_temperature', 'soil_moisture', 'solar_radiation',
+    'weather_condition', 'timestamp', 'created_at', 'data_source'
+) + _RELATED_LOCATION_FIELDS
+FORECAST_FIELDS = (
+    'id', 'location', 'forecast_date', 'min_temperature', 'max_temperature',
+    'humidity', 'rainfall_probability', 'expected_rainfall', 'wind_speed',
+    'weather_condition', 'frost_risk', 'heat_stress_risk', 'created_at',
+    'confidence_level'
+) + _RELATED_LOCATION_FIELDS
+
+# Per-forecast agricultural risk flags, computed by the database
+_FORECAST_RISK_ANNOTATIONS = {
+    'avg_temp': ExpressionWrapper(
+        (F('max_temperature') + F('min_temperature')) / 2.0,
+        output_field=FloatField()
+    ),
+    'frost_risk_calc': _flag(Q(min_temperature__lte=2)),
+    'heat_stress_risk_calc': _flag(Q(max_temperature__gte=35)),
+    'disease_risk_calc': _flag(Q(humidity__gte=80, avg_temp__gte=20)),
+    'ideal_growing_calc': _flag(Q(
+        max_temperature__gte=15, max_temperature__lte=30,
+        humidity__gte=40, humidity__lte=70,
+        expected_rainfall__gt=0
+    )),
+}
+
+
+class LanguageContextMixin:
+    """Resolve the request language and its translator once per request."""
+
+    # Weather payloads are large and nested; render them with orjson if present
+    renderer_classes = [JSONRenderer, BrowsableAPIRenderer]
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.language = request.query_params.get(
+            'language', WEATHER_CONFIG['DEFAULT_LANGUAGE']
+        )
+        self.translator = get_translator(self.language)
+
+
+class LocationViewSet(LanguageContextMixin, viewsets.ModelViewSet):
     queryset = Location.objects.all()
     serializer_class = LocationSerializer
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
         """List all locations with language support."""
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
-        serializer = LocationSerializer(self.queryset, many=True, context={'language': language})
+        serializer = LocationSerializer(self.get_queryset(), many=True, context={'language': self.language})
         return Response(serializer.data)
 
     def retrieve(self, request, pk=None):
         """Retrieve a specific location with language support."""
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         try:
-            location = Location.objects.get(pk=pk)
-        except Location.DoesNotExist:
+            location = WeatherRepository().get_location(int(pk))
+        except (ValueError, InvalidLocationError):
             return Response(status=status.HTTP_404_NOT_FOUND)
-        serializer = LocationSerializer(location, context={'language': language})
+        serializer = LocationSerializer(location, context={'language': self.language})
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
@@ -51,7 +119,6 @@ class LocationViewSet(viewsets.ModelViewSet):
         lat = request.query_params.get('latitude')
         lon = request.query_params.get('longitude')
         radius = request.query_params.get('radius', 10)  # Default 10km radius
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
 
         if not all([lat, lon]):
             return Response(
@@ -60,8 +127,8 @@ class LocationViewSet(viewsets.ModelViewSet):
             )
 
         try:
-            lat = Decimal(lat)
-            lon = Decimal(lon)
+            lat = float(lat)
+            lon = float(lon)
             radius = float(radius)
         except (ValueError, TypeError):
             return Response(
@@ -69,21 +136,13 @@ class LocationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Using the Haversine formula for distance calculation
-        locations = Location.objects.raw("""
-            SELECT *,
-            (6371 * acos(cos(radians(%s)) * cos(radians(latitude))
-            * cos(radians(longitude) - radians(%s)) + sin(radians(%s))
-            * sin(radians(latitude)))) AS distance
-            FROM weather_location
-            HAVING distance < %s
-            ORDER BY distance
-        """, [lat, lon, lat, radius])
-
-        serializer = LocationSerializer(locations, many=True, context={'language': language})
+        # Index-pruned bounding box in SQL, exact Haversine on the candidates
+        locations = WeatherRepository().get_nearby_locations(lat, lon, radius)
+
+        serializer = LocationSerializer(locations, many=True, context={'language': self.language})
         return Response(serializer.data)
 
-class WeatherDataViewSet(viewsets.ModelViewSet):
+class WeatherDataViewSet(LanguageContextMixin, viewsets.ModelViewSet):
     queryset = WeatherData.objects.all()
     serializer_class = WeatherDataSerializer
     permission_classes = [IsAuthenticated]
@@ -104,7 +163,6 @@ class WeatherDataViewSet(viewsets.ModelViewSet):
     def agricultural_metrics(self, request):
         """Get weather metrics specifically relevant for agriculture with language support."""
         location_id = request.query_params.get('location_id')
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if not location_id:
             return Response(
@@ -112,18 +170,21 @@ class WeatherDataViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            weather = WeatherData.objects.get(location_id=location_id)
-        except WeatherData.DoesNotExist:
+        weather = (WeatherData.objects.filter(location_id=location_id)
+                   .select_related('location')
+                   .only(*WEATHER_FIELDS)
+                   .order_by('-timestamp')
+                   .first())
+        if weather is None:
             return Response(
                 {"error": "No weather data available for this location"},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = WeatherDataSerializer(weather, context={'language': language})
+        serializer = WeatherDataSerializer(weather, context={'language': self.language})
         return Response(serializer.data)
 
-class WeatherForecastViewSet(viewsets.ModelViewSet):
+class WeatherForecastViewSet(LanguageContextMixin, viewsets.ModelViewSet):
     queryset = WeatherForecast.objects.all()
     serializer_class = WeatherForecastSerializer
     permission_classes = [IsAuthenticated]
@@ -144,7 +205,6 @@ class WeatherForecastViewSet(viewsets.ModelViewSet):
     def weekly(self, request):
         """Get 7-day weather forecast with agricultural insights and language support."""
         location_id = request.query_params.get('location_id')
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if not location_id:
             return Response(
@@ -152,15 +212,15 @@ class WeatherForecastViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        forecasts = WeatherForecast.objects.filter(location_id=location_id)
-        serializer = WeatherForecastSerializer(forecasts, many=True, context={'language': language})
+        forecasts = (WeatherForecast.objects.filter(location_id=location_id)
+                     .select_related('location'))
+        serializer = WeatherForecastSerializer(forecasts, many=True, context={'language': self.language})
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def monthly_outlook(self, request):
         """Get monthly weather outlook for agricultural planning with language support"""
         location_id = request.query_params.get('location_id')
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if not location_id:
             return Response(
@@ -173,51 +233,71 @@ class WeatherForecastViewSet(viewsets.ModelViewSet):
             location_id=location_id,
             forecast_date__gte=today,
             forecast_date__lt=today + timedelta(days=30)
-        ).order_by('forecast_date')
+        ).annotate(
+            avg_temp=(F('max_temperature') + F('min_temperature')) / 2.0
+        )
 
-        # Weekly aggregations with translated labels
-        translator = WeatherTranslator(language)
-        weekly_stats = []
+        # All four weekly buckets are reduced in a single aggregate query
+        aggregates = {}
         for i in range(4):  # 4 weeks
             week_start = today + timedelta(days=i*7)
-            week_end = week_start + timedelta(days=7)
-            week_forecasts = [f for f in forecasts if week_start <= f.forecast_date < week_end]
-            
-            if week_forecasts:
+            in_week = Q(forecast_date__gte=week_start,
+                        forecast_date__lt=week_start + timedelta(days=7))
+            aggregates.update({
+                f'days_{i}': Count('id', filter=in_week),
+                f'avg_temp_{i}': Avg('avg_temp', filter=in_week),
+                f'rainfall_{i}': Sum('expected_rainfall', filter=in_week),
+                f'frost_{i}': Count('id', filter=in_week & Q(frost_risk=True)),
+                f'heat_{i}': Count('id', filter=in_week & Q(heat_stress_risk=True)),
+                f'favorable_{i}': Count(
+                    'id', filter=in_week & Q(avg_temp__gte=15, avg_temp__lte=30)
+                ),
+            })
+        totals = forecasts.aggregate(**aggregates)
+
+        # Weekly aggregations; day counts are plain ints, only labels are translated
+        translator = self.translator
+        weekly_stats = []
+        for i in range(4):
+            if totals[f'days_{i}']:
                 weekly_stats.append({
-                    'week_starting': week_start,
-                    'avg_temperature': sum((f.max_temperature + f.min_temperature)/2 for f in week_forecasts) / len(week_forecasts),
-                    'total_expected_rainfall': sum(f.expected_rainfall for f in week_forecasts),
-                    'frost_risk_days': translator.get_farming_action('FROST_RISK_DAYS', count=sum(1 for f in week_forecasts if f.frost_risk)),
-                    'heat_stress_days': translator.get_farming_action('HEAT_STRESS_DAYS', count=sum(1 for f in week_forecasts if f.heat_stress_risk)),
-                    'favorable_days': translator.get_farming_action('FAVORABLE_DAYS', count=sum(1 for f in week_forecasts if 15 <= (f.max_temperature + f.min_temperature)/2 <= 30))
+                    'week_starting': today + timedelta(days=i*7),
+                    'avg_temperature': totals[f'avg_temp_{i}'],
+                    'total_expected_rainfall': totals[f'rainfall_{i}'],
+                    'frost_risk_days': totals[f'frost_{i}'],
+                    'heat_stress_days': totals[f'heat_{i}'],
+                    'favorable_days': totals[f'favorable_{i}']
                 })
 
         return Response({
             'weekly_outlook': weekly_stats,
             'monthly_summary': {
                 'total_expected_rainfall': sum(week['total_expected_rainfall'] for week in weekly_stats),
-                'avg_favorable_days_per_week': translator.get_farming_action('AVG_FAVORABLE_DAYS', days=sum(week['favorable_days']['count'] for week in weekly_stats) / len(weekly_stats)),
+                'avg_favorable_days_per_week': (
+                    sum(week['favorable_days'] for week in weekly_stats) / len(weekly_stats)
+                    if weekly_stats else 0
+                ),
                 'extreme_weather_risk': translator.get_alert_type('EXTREME_WEATHER_RISK') if any(
-                    week['frost_risk_days']['count'] > 2 or week['heat_stress_days']['count'] > 2
+                    week['frost_risk_days'] > 2 or week['heat_stress_days'] > 2
                     for week in weekly_stats
                 ) else translator.get_alert_type('MODERATE_WEATHER_RISK')
             }
         })
 
-class WeatherAlertViewSet(viewsets.ModelViewSet):
+class WeatherAlertViewSet(LanguageContextMixin, viewsets.ModelViewSet):
     queryset = WeatherAlert.objects.all()
     serializer_class = WeatherAlertSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        queryset = WeatherAlert.objects.all().select_related('location')
+        queryset = (WeatherAlert.objects.all()
+                    .select_related('location')
+                    .prefetch_related('affected_crops'))
         location_id = self.request.query_params.get('location_id')
         district = self.request.query_params.get('district')
         crop_id = self.request.query_params.get('crop_id')
         alert_type = self.request.query_params.get('alert_type')
         severity = self.request.query_params.get('severity')
-        language = self.request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if location_id:
             queryset = queryset.filter(location_id=location_id)
@@ -235,9 +315,8 @@ class WeatherAlertViewSet(viewsets.ModelViewSet):
 
     def list(self, request):
         """List alerts with language support"""
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         queryset = self.get_queryset()
-        serializer = WeatherAlertSerializer(queryset, many=True, context={'language': language})
+        serializer = WeatherAlertSerializer(queryset, many=True, context={'language': self.language})
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
@@ -245,7 +324,6 @@ class WeatherAlertViewSet(viewsets.ModelViewSet):
         """Get active weather alerts with agricultural impact assessment"""
         location_id = request.query_params.get('location_id')
         crop_id = request.query_params.get('crop_id')
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if not location_id:
             return Response(
@@ -267,7 +345,7 @@ class WeatherAlertViewSet(viewsets.ModelViewSet):
                  .prefetch_related('affected_crops')
                  .order_by('-severity', '-start_time'))
 
-        serializer = WeatherAlertSerializer(alerts, many=True, context={'language': language})
+        serializer = WeatherAlertSerializer(alerts, many=True, context={'language': self.language})
         return Response(serializer.data)
 
     @action(detail=True, methods=['post'])
@@ -313,32 +391,53 @@ class WeatherAlertViewSet(viewsets.ModelViewSet):
         
         alerts = WeatherAlert.objects.filter(base_query)
 
+        # Scalar counts in one filtered aggregate, crop ranking in a second query
+        totals = alerts.aggregate(
+            total=Count('id', distinct=True),
+            avg_duration=Avg(
+                F('resolved_at') - F('start_time'),
+                filter=Q(resolved_at__isnull=False)
+            ),
+            **{
+                f'severity_{severity}': Count('id', distinct=True, filter=Q(severity=severity))
+                for severity, _ in WeatherAlert.SEVERITY_CHOICES
+            },
+            **{
+                f'type_{alert_type}': Count('id', distinct=True, filter=Q(alert_type=alert_type))
+                for alert_type, _ in WeatherAlert.ALERT_TYPES
+            }
+        )
+
         stats = {
-            'total_alerts': alerts.count(),
-            'by_severity': alerts.values('severity').annotate(count=Count('id')),
-            'by_type': alerts.values('alert_type').annotate(count=Count('id')),
-            'most_affected_crops': (
+            'total_alerts': totals['total'],
+            'by_severity': [
+                {'severity': severity, 'count': totals[f'severity_{severity}']}
+                for severity, _ in WeatherAlert.SEVERITY_CHOICES
+                if totals[f'severity_{severity}']
+            ],
+            'by_type': [
+                {'alert_type': alert_type, 'count': totals[f'type_{alert_type}']}
+                for alert_type, _ in WeatherAlert.ALERT_TYPES
+                if totals[f'type_{alert_type}']
+            ],
+            'most_affected_crops': list(
                 alerts.values('affected_crops__name')
-                .annotate(count=Count('id'))
+                .annotate(count=Count('id', distinct=True))
                 .order_by('-count')[:5]
             ),
-            'average_duration_hours': alerts.filter(
-                resolved_at__isnull=False
-            ).aggregate(
-                avg_duration=Avg(F('resolved_at') - F('start_time'))
-            )['avg_duration']
+            'average_duration_hours': totals['avg_duration']
         }
 
         return Response(stats)
 
-class LocationWeatherViewSet(viewsets.ViewSet):
+class LocationWeatherViewSet(LanguageContextMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(cache_control(max_age=WEATHER_CONFIG['CACHE_TIMEOUT'], public=False))
     def list(self, request):
         """Get comprehensive weather information with localized agricultural insights"""
         location_id = request.query_params.get('location_id')
         crop_id = request.query_params.get('crop_id')
-        language = request.query_params.get('language', WEATHER_CONFIG['DEFAULT_LANGUAGE'])
         
         if not location_id:
             return Response(
@@ -346,9 +445,19 @@ class LocationWeatherViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Responses are shared per parameter set within a cache-timeout bucket
+        timeout = WEATHER_CONFIG['CACHE_TIMEOUT']
+        cache_key = (
+            f"{WEATHER_CONFIG['CACHE_KEY_PREFIX']}location_weather_"
+            f"{location_id}:{crop_id or '-'}:{self.language}:{int(time.time() // timeout)}"
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
         try:
-            location = Location.objects.get(id=location_id)
-        except Location.DoesNotExist:
+            location = WeatherRepository().get_location(int(location_id))
+        except (ValueError, InvalidLocationError):
             return Response(
                 {"error": "Location not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -357,6 +466,7 @@ class LocationWeatherViewSet(viewsets.ViewSet):
         # Get current weather with agricultural metrics
         current_weather = (WeatherData.objects.filter(location_id=location_id)
                          .select_related('location')
+                         .only(*WEATHER_FIELDS)
                          .order_by('-timestamp')
                          .first())
         
@@ -366,22 +476,26 @@ class LocationWeatherViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # Get active alerts
-        active_alerts = (WeatherAlert.objects.filter(
+        # Get active alerts; evaluated once and summarised in Python below
+        active_alerts = list(WeatherAlert.objects.filter(
             location_id=location_id,
             is_active=True,
             end_time__gt=timezone.now()
         ).select_related('location')
          .prefetch_related('affected_crops')
          .order_by('-severity'))
+        alert_type_counts = Counter(alert.alert_type for alert in active_alerts)
 
-        # Get forecasts with agricultural insights
+        # Get forecasts with agricultural insights; materialized once and
+        # shared by the weekly outlook and the per-forecast enrichment
         today = timezone.now().date()
-        forecasts = (WeatherForecast.objects.filter(
+        forecasts = list(WeatherForecast.objects.filter(
             location_id=location_id,
             forecast_date__gte=today,
             forecast_date__lt=today + timedelta(days=7)
         ).select_related('location')
+         .only(*FORECAST_FIELDS)
+         .annotate(**_FORECAST_RISK_ANNOTATIONS)
          .order_by('forecast_date'))
 
         # Get historical context and soil conditions
@@ -445,79 +559,68 @@ class LocationWeatherViewSet(viewsets.ViewSet):
                     )
                 },
                 'alert_summary': {
-                    'total_active': active_alerts.count(),
-                    'high_severity': active_alerts.filter(severity__in=['HIGH', 'EXTREME']).count(),
-                    'types': active_alerts.values('alert_type').annotate(count=Count('id'))
+                    'total_active': len(active_alerts),
+                    'high_severity': sum(
+                        1 for alert in active_alerts
+                        if alert.severity in ('HIGH', 'EXTREME')
+                    ),
+                    'types': [
+                        {'alert_type': alert_type, 'count': count}
+                        for alert_type, count in alert_type_counts.items()
+                    ]
                 },
                 'weekly_outlook': {
                     'total_expected_rainfall': sum(f.expected_rainfall for f in forecasts),
                     'frost_risk_days': sum(1 for f in forecasts if f.frost_risk),
                     'heat_stress_days': sum(1 for f in forecasts if f.heat_stress_risk),
-                    'favorable_days': sum(1 for f in forecasts if 15 <= (f.max_temperature + f.min_temperature)/2 <= 30)
+                    'favorable_days': sum(1 for f in forecasts if 15 <= f.avg_temp <= 30)
                 }
             }
         }
 
         # Process forecasts with agricultural insights
-        for forecast in forecasts:
-            forecast_data = WeatherForecastSerializer(forecast).data
-            
+        crop = Crop.objects.filter(id=crop_id).first() if crop_id else None
+        serialized_forecasts = WeatherForecastSerializer(forecasts, many=True).data
+        for forecast, forecast_data in zip(forecasts, serialized_forecasts):
             # Add agricultural risk assessments
             forecast_data['agricultural_risks'] = {
-                'frost_risk': forecast.min_temperature <= 2,
-                'heat_stress_risk': forecast.max_temperature >= 35,
-                'disease_risk': (
-                    forecast.humidity >= 80 and 
-                    ((forecast.max_temperature + forecast.min_temperature) / 2) >= 20
-                ),
-                'ideal_growing_conditions': (
-                    15 <= forecast.max_temperature <= 30 and
-                    40 <= forecast.humidity <= 70 and
-                    forecast.expected_rainfall > 0
-                )
+                'frost_risk': forecast.frost_risk_calc,
+                'heat_stress_risk': forecast.heat_stress_risk_calc,
+                'disease_risk': forecast.disease_risk_calc,
+                'ideal_growing_conditions': forecast.ideal_growing_calc
             }
             
             # Add crop-specific insights if crop_id is provided
-            if crop_id:
-                from crops.models import Crop
-                try:
-                    crop = Crop.objects.get(id=crop_id)
-                    forecast_data['crop_specific'] = {
-                        'crop_name': crop.name,
-                        'temperature_suitable': (
-                            crop.min_temp <= forecast.max_temperature <= crop.max_temp
-                        ),
-                        'humidity_suitable': (
-                            crop.min_humidity <= forecast.humidity <= crop.max_humidity
-                        ),
-                        'water_requirement': (
-                            'high' if forecast.rainfall_probability < 30 else
-                            'low' if forecast.rainfall_probability > 70 else
-                            'moderate'
-                        ),
-                        'recommended_actions': []
-                    }
-                    
-                    # Add recommended actions based on conditions
-                    if forecast.min_temperature <= crop.min_temp:
-                        forecast_data['crop_specific']['recommended_actions'].append(
-                            "Protect crop from cold conditions"
-                        )
-                    if forecast.max_temperature >= crop.max_temp:
-                        forecast_data['crop_specific']['recommended_actions'].append(
-                            "Implement heat stress mitigation measures"
-                        )
-                    if forecast.humidity > crop.max_humidity:
-                        forecast_data['crop_specific']['recommended_actions'].append(
-                            "Monitor for disease due to high humidity"
-                        )
-                    if forecast.rainfall_probability < 30:
-                        forecast_data['crop_specific']['recommended_actions'].append(
-                            "Plan for irrigation"
-                        )
-                except Crop.DoesNotExist:
-                    pass
+            if crop is not None:
+                rules = (
+                    (forecast.min_temperature <= crop.min_temp,
+                     "Protect crop from cold conditions"),
+                    (forecast.max_temperature >= crop.max_temp,
+                     "Implement heat stress mitigation measures"),
+                    (forecast.humidity > crop.max_humidity,
+                     "Monitor for disease due to high humidity"),
+                    (forecast.rainfall_probability < 30,
+                     "Plan for irrigation"),
+                )
+                forecast_data['crop_specific'] = {
+                    'crop_name': crop.name,
+                    'temperature_suitable': (
+                        crop.min_temp <= forecast.max_temperature <= crop.max_temp
+                    ),
+                    'humidity_suitable': (
+                        crop.min_humidity <= forecast.humidity <= crop.max_humidity
+                    ),
+                    'water_requirement': (
+                        'high' if forecast.rainfall_probability < 30 else
+                        'low' if forecast.rainfall_probability > 70 else
+                        'moderate'
+                    ),
+                    'recommended_actions': [
+                        action for applies, action in rules if applies
+                    ]
+                }
             
             data['forecasts'].append(forecast_data)
 
+        cache.set(cache_key, data, timeout)
         return Response(data)